@@ -3,6 +3,9 @@ from utils.constants import BLACK
 
 class Entity:
     """Base class for all game entities"""
+
+    # Slots keep short-lived entities like bullets small, subclasses without __slots__ still get a __dict__
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'rect', 'current_sprite')
     
     def __init__(self, x, y, width, height, color=BLACK):
         """Initialize the entity
@@ -8,6 +8,17 @@ from utils.constants import (
 from systems.collisions import resolve_movement
 from systems.items.item_effects import EffectManager
 
+# Movement keys, resolved once instead of through pygame attribute lookups every frame
+_K_LEFT, _K_RIGHT, _K_UP, _K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+_K_A, _K_D, _K_W, _K_S = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s
+
+# Per-axis scale that keeps diagonal movement at unit length
+_DIAGONAL_SCALE = 1 / math.sqrt(2)
+
+# Map bounds in pixels for clamping the player position
+_MAP_WIDTH_PX = MAP_WIDTH * TILE_SIZE
+_MAP_HEIGHT_PX = MAP_HEIGHT * TILE_SIZE
+
 
 class Player(Entity):
     """Player entity s weapon inventory systémem"""
@@ -157,7 +168,11 @@ class Player(Entity):
             pygame.draw.rect(screen, self.color, (draw_x, draw_y, self.width, self.height))
 
     def shoot(self):
-        """Shoot with current weapon"""
+        """Shoot with current weapon
+
+        Returns:
+            list: Fired projectiles, empty if the weapon could not shoot
+        """
         current_weapon = self.weapon_inventory.get_current_weapon()
         if current_weapon and current_weapon.can_shoot():
             # Pass player center position to weapon
@@ -172,14 +187,11 @@ class Player(Entity):
                 damage_multiplier = self.effect_manager.get_damage_multiplier()
 
                 # Apply damage multiplier to each projectile
-                if isinstance(projectiles, list):
-                    for projectile in projectiles:
-                        projectile.damage = int(projectile.damage * damage_multiplier)
-                else:
-                    projectiles.damage = int(projectiles.damage * damage_multiplier)
+                for projectile in projectiles:
+                    projectile.damage = int(projectile.damage * damage_multiplier)
 
             return projectiles
-        return None
+        return []
 
     def reload(self):
         """Reload current weapon"""
@@ -260,24 +272,16 @@ class Player(Entity):
 
     def _handle_movement(self, dt, keys_pressed):
         """Handle player movement based on input with collision detection"""
-        dx = dy = 0
-
-        if keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]:
-            dx = -1
-        if keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]:
-            dx = 1
-        if keys_pressed[pygame.K_w] or keys_pressed[pygame.K_UP]:
-            dy = -1
-        if keys_pressed[pygame.K_s] or keys_pressed[pygame.K_DOWN]:
-            dy = 1
+        # Opposing keys cancel out, each axis ends up as -1, 0 or 1
+        dx = (keys_pressed[_K_D] or keys_pressed[_K_RIGHT]) - (keys_pressed[_K_A] or keys_pressed[_K_LEFT])
+        dy = (keys_pressed[_K_S] or keys_pressed[_K_DOWN]) - (keys_pressed[_K_W] or keys_pressed[_K_UP])
 
         # Only process movement if there's input
         if dx != 0 or dy != 0:
             # Normalize diagonal movement
             if dx != 0 and dy != 0:
-                length = math.sqrt(dx * dx + dy * dy)
-                dx /= length
-                dy /= length
+                dx *= _DIAGONAL_SCALE
+                dy *= _DIAGONAL_SCALE
 
             # Calculate base speed
             base_speed = self.speed
@@ -295,13 +299,9 @@ class Player(Entity):
             # Use collision system to resolve movement
             new_x, new_y, collided = resolve_movement(self, dx, dy, dt, base_speed)
 
-            # Check map boundaries
-            map_width_px = MAP_WIDTH * TILE_SIZE
-            map_height_px = MAP_HEIGHT * TILE_SIZE
-
             # Clamp to map boundaries
-            new_x = max(0, min(new_x, map_width_px - self.width))
-            new_y = max(0, min(new_y, map_height_px - self.height))
+            new_x = max(0, min(new_x, _MAP_WIDTH_PX - self.width))
+            new_y = max(0, min(new_y, _MAP_HEIGHT_PX - self.height))
 
             # Apply the movement
             self.x = new_x
@@ -2,6 +2,9 @@ import math
 import pygame
 import random
 from entities.entity import Entity
+from systems.audio import music_manager
+from systems.collisions import resolve_movement
+from utils.sprite_loader import get_texture, get_sprite
 from utils.constants import (
     # Zombie sizes
     ENEMY_SIZE, TOUGH_ZOMBIE_SIZE, FAST_ZOMBIE_SIZE,
@@ -31,6 +34,10 @@ from utils.constants import (
     MAP_WIDTH, TILE_SIZE, MAP_HEIGHT
 )
 
+# Map bounds in pixels for teleport target checks
+_MAP_WIDTH_PX = MAP_WIDTH * TILE_SIZE
+_MAP_HEIGHT_PX = MAP_HEIGHT * TILE_SIZE
+
 
 class Zombie(Entity):
     """Zombie entity that follows the player"""
@@ -44,7 +51,6 @@ class Zombie(Entity):
         """
         super().__init__(x, y, ENEMY_SIZE, ENEMY_SIZE, BLACK)
         # Random speed for weak zombies
-        import random
         self.speed = random.uniform(ZOMBIE_SPEED_MIN, ZOMBIE_SPEED_MAX)
         self.is_on_object = False
         self.map_generator = None
@@ -98,7 +104,6 @@ class Zombie(Entity):
 
             # Play zombie groan sound (with a chance to not play to avoid too many sounds)
             if random.random() < 0.3 and player_x is not None:  # 30% chance to groan when player is in game
-                from systems.audio import music_manager
                 music_manager.play_sound("zombies_zombie_groan", volume=0.4)  # Lower volume for ambient groans
 
         # If no player position provided, just update timers
@@ -153,8 +158,6 @@ class Zombie(Entity):
         # Reset stuck counter
         self.stuck_counter = 0
 
-        import random
-        import math
 
         # Try to find a good teleport position just outside screen but closer than current position
         current_distance_to_player = math.sqrt((self.x - player_x) ** 2 + (self.y - player_y) ** 2)
@@ -185,10 +188,8 @@ class Zombie(Entity):
                 is_walkable = self.map_generator.is_walkable(teleport_x, teleport_y)
 
             # Check if position is within map bounds
-            map_width_px = MAP_WIDTH * TILE_SIZE
-            map_height_px = MAP_HEIGHT * TILE_SIZE
-            is_in_map = (50 <= teleport_x <= map_width_px - 50 and
-                         50 <= teleport_y <= map_height_px - 50)
+            is_in_map = (50 <= teleport_x <= _MAP_WIDTH_PX - 50 and
+                         50 <= teleport_y <= _MAP_HEIGHT_PX - 50)
 
             if is_just_off_screen and is_walkable and is_in_map:
                 # Teleport the zombie
@@ -216,9 +217,7 @@ class Zombie(Entity):
 
         for dir_x, dir_y, name in directions:
             # Check if position is within map bounds
-            map_width_px = MAP_WIDTH * TILE_SIZE
-            map_height_px = MAP_HEIGHT * TILE_SIZE
-            if 50 <= dir_x <= map_width_px - 50 and 50 <= dir_y <= map_height_px - 50:
+            if 50 <= dir_x <= _MAP_WIDTH_PX - 50 and 50 <= dir_y <= _MAP_HEIGHT_PX - 50:
                 # Check if walkable
                 if self.map_generator and self.map_generator.is_walkable(dir_x, dir_y):
                     dist_to_zombie = math.sqrt((dir_x - self.x) ** 2 + (dir_y - self.y) ** 2)
@@ -261,22 +260,24 @@ class Zombie(Entity):
         self.stuck_timer += dt
 
         if self.stuck_timer >= self.stuck_check_interval:
-            # Calculate distance moved since last check
-            distance_moved = math.sqrt(
-                (self.x - self.last_position[0]) ** 2 +
-                (self.y - self.last_position[1]) ** 2
-            )
+            # Calculate squared distance moved since last check, all distances here are compared squared
+            moved_x = self.x - self.last_position[0]
+            moved_y = self.y - self.last_position[1]
+            distance_moved_sq = moved_x * moved_x + moved_y * moved_y
 
             # Check distance to player
-            distance_to_player = math.sqrt((self.x - player_x) ** 2 + (self.y - player_y) ** 2)
+            to_player_x = self.x - player_x
+            to_player_y = self.y - player_y
+            distance_to_player_sq = to_player_x * to_player_x + to_player_y * to_player_y
 
             # ONLY allow teleportation if zombie is FAR from player (off-screen)
-            is_far_from_player = distance_to_player > 500  # More than 500px from player
+            is_far_from_player = distance_to_player_sq > 500 * 500  # More than 500px from player
 
             # Check if zombie is trying to move towards player but not moving much
-            should_be_moving = distance_to_player > 50  # Should move if more than 50 pixels away
+            should_be_moving = distance_to_player_sq > 50 * 50  # Should move if more than 50 pixels away
 
-            if should_be_moving and distance_moved < ZOMBIE_MIN_MOVEMENT_DISTANCE and is_far_from_player:
+            is_barely_moving = distance_moved_sq < ZOMBIE_MIN_MOVEMENT_DISTANCE * ZOMBIE_MIN_MOVEMENT_DISTANCE
+            if should_be_moving and is_barely_moving and is_far_from_player:
                 # Zombie should be moving but isn't AND is far from player - increment stuck counter
                 self.stuck_counter += self.stuck_check_interval
 
@@ -328,7 +329,6 @@ class Zombie(Entity):
             dy /= distance
 
             # Use the collision system to resolve movement with wall collision detection
-            from systems.collisions import resolve_movement
             new_x, new_y, collided = resolve_movement(self, dx, dy, dt, base_speed)
             self.x, self.y = new_x, new_y
 
@@ -356,10 +356,9 @@ class Zombie(Entity):
             # Calculate distance to player
             dx = player.x - self.x
             dy = player.y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
 
-            # Only attack if within range
-            if distance <= ZOMBIE_ATTACK_RANGE:
+            # Only attack if within range, compared squared
+            if dx * dx + dy * dy <= ZOMBIE_ATTACK_RANGE * ZOMBIE_ATTACK_RANGE:
                 # Store the attack angle (direction towards player when attack starts)
                 self.attack_angle = math.atan2(dy, dx)
 
@@ -371,7 +370,6 @@ class Zombie(Entity):
                 self.attack_timer = ZOMBIE_ATTACK_COOLDOWN
 
                 # Play zombie attack sound
-                from systems.audio import music_manager
                 music_manager.play_sound("zombies_zombie_attack")
 
                 # Deal damage to player
@@ -420,11 +418,9 @@ class Zombie(Entity):
 
         # Get zombie sprite from texture atlas - use stand sprite during attack, hold sprite otherwise
         sprite_name = 'zoimbie1_stand' if self.is_attacking else 'zoimbie1_hold'
-        from utils.sprite_loader import get_texture
         sprite = get_texture('zombie', sprite_name)
         if not sprite:
             # Fallback to old sprite system
-            from utils.sprite_loader import get_sprite
             sprite = get_sprite('zombie_basic_1')
 
         if sprite:
@@ -438,7 +434,6 @@ class Zombie(Entity):
             rotation_angle = math.degrees(-angle_to_use)
 
             # Rotate the zombie sprite
-            import pygame
             rotated_sprite = pygame.transform.rotate(sprite, rotation_angle)
 
             # Calculate position to center the rotated sprite on the zombie
@@ -487,7 +482,6 @@ class Zombie(Entity):
             # Fallback: draw circle if sprite not available
             if self.is_on_object:
                 # Create a transparent surface for the zombie when on an object
-                import pygame
                 circle_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 # Draw a semi-transparent circle (128 is 50% opacity)
                 pygame.draw.circle(circle_surface, (*self.color, 128), (self.width // 2, self.height // 2),
@@ -497,7 +491,6 @@ class Zombie(Entity):
             else:
                 # Draw zombie normally when not on an object
                 color = YELLOW if self.is_force_pathfinding else self.color  # Yellow when force pathfinding
-                import pygame
                 pygame.draw.circle(screen, color, (center_x, center_y), self.width // 2)
 
     def _apply_zombie_tint(self, sprite):
@@ -557,10 +550,9 @@ class ToughZombie(Zombie):
             # Calculate distance to player
             dx = player.x - self.x
             dy = player.y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
 
-            # Only attack if within range
-            if distance <= ZOMBIE_ATTACK_RANGE:
+            # Only attack if within range, compared squared
+            if dx * dx + dy * dy <= ZOMBIE_ATTACK_RANGE * ZOMBIE_ATTACK_RANGE:
                 # Store the attack angle (direction towards player when attack starts)
                 self.attack_angle = math.atan2(dy, dx)
 
@@ -572,7 +564,6 @@ class ToughZombie(Zombie):
                 self.attack_timer = ZOMBIE_ATTACK_COOLDOWN
 
                 # Play zombie attack sound
-                from systems.audio import music_manager
                 music_manager.play_sound("zombies_zombie_attack")
 
                 # Deal damage to player (more damage than regular zombie)
@@ -598,11 +589,9 @@ class ToughZombie(Zombie):
 
         # Get zombie sprite from texture atlas - use stand sprite during attack, hold sprite otherwise
         sprite_name = 'zoimbie1_stand' if self.is_attacking else 'zoimbie1_hold'
-        from utils.sprite_loader import get_texture
         sprite = get_texture('zombie', sprite_name)
         if not sprite:
             # Fallback to old sprite system
-            from utils.sprite_loader import get_sprite
             sprite = get_sprite('zombie_tank_1')
 
         if sprite:
@@ -733,10 +722,9 @@ class FastZombie(Zombie):
             # Calculate distance to player
             dx = player.x - self.x
             dy = player.y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
 
-            # Only attack if within range
-            if distance <= ZOMBIE_ATTACK_RANGE:
+            # Only attack if within range, compared squared
+            if dx * dx + dy * dy <= ZOMBIE_ATTACK_RANGE * ZOMBIE_ATTACK_RANGE:
                 # Store the attack angle (direction towards player when attack starts)
                 self.attack_angle = math.atan2(dy, dx)
 
@@ -748,7 +736,6 @@ class FastZombie(Zombie):
                 self.attack_timer = ZOMBIE_ATTACK_COOLDOWN * 0.7  # 30% faster attacks
 
                 # Play zombie attack sound
-                from systems.audio import music_manager
                 music_manager.play_sound("zombies_zombie_attack")
 
                 # Deal damage to player (less damage than regular zombie)
@@ -774,11 +761,9 @@ class FastZombie(Zombie):
 
         # Get zombie sprite from texture atlas - use stand sprite during attack, hold sprite otherwise
         sprite_name = 'zoimbie1_stand' if self.is_attacking else 'zoimbie1_hold'
-        from utils.sprite_loader import get_texture
         sprite = get_texture('zombie', sprite_name)
         if not sprite:
             # Fallback to old sprite system
-            from utils.sprite_loader import get_sprite
             sprite = get_sprite('zombie_runner_1')
 
         if sprite:
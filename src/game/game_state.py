@@ -9,10 +9,12 @@ Refactored to use proper collision system and animation system.
 import pygame
 import math
 from abc import ABC, abstractmethod
+from functools import partial
 
 from entities.zombies import FastZombie
 from systems import collisions
 from utils.constants import *
+from utils.fonts import get_font
 from systems.audio import sound_manager
 from systems.collisions import check_entity_collision, initialize as collision_init
 from systems.enemy_spawner import EnemySpawner
@@ -21,10 +23,46 @@ from systems.animation import animation_system  # Import global animation system
 from entities.player import Player
 from game.map_generator import MapGenerator
 
+# Parsed high_scores.json as (mtime, scores), reused until the file changes on disk
+_HIGH_SCORES_CACHE = None
+
+# Weapon types mapped to their sound names in the 'weapons' category
+_WEAPON_SOUND = {
+    "pistol": "weapons_pistol",
+    "shotgun": "weapons_shotgun",
+    "assault_rifle": "weapons_assault",
+    "sniper_rifle": "weapons_sniper",
+    "bazooka": "weapons_bazooka_fire"
+}
+
+
+def _build_static_frame(blits):
+    """Compose static screen content onto one full-window surface, blitted each frame in a single call"""
+    frame = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    if pygame.display.get_surface() is not None:
+        frame = frame.convert()
+    frame.fill(BLACK)
+    frame.blits(blits, doreturn=False)
+    return frame
+
+
+def _render_text(font, text, color):
+    """Render antialiased text, converted to the display pixel format when a display exists"""
+    surface = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
 
 class GameState(ABC):
     """Abstract base class for all game states"""
 
+    # Whether the main loop must clear the screen first, states that cover every pixel set this to False
+    needs_clear = True
+
+    # Whether render() draws the fps value, the main loop skips measuring it otherwise
+    shows_fps = False
+
     @abstractmethod
     def update(self, dt):
         """Update state logic"""
@@ -40,23 +78,66 @@ class GameState(ABC):
         """Render state"""
         pass
 
+    def on_enter(self):
+        """Called by the manager each time this state becomes active"""
+        pass
+
+    def on_exit(self):
+        """Called by the manager when switching away from this state"""
+        pass
+
 
 class MenuState(GameState):
     """Main menu state"""
 
+    needs_clear = False  # The static frame covers the whole screen
+    shows_fps = True
+
     def __init__(self):
         """Initialize menu state"""
-        self.font = pygame.font.Font(None, 74)
+        self.font = get_font(None, 74)
         self.title_text = self.font.render("DEADLOCK", True, WHITE)
 
-        self.subtitle_font = pygame.font.Font(None, 36)
+        self.subtitle_font = get_font(None, 36)
         self.subtitle_text = self.subtitle_font.render("Press SPACE to Start", True, WHITE)
         self.highscores_text = self.subtitle_font.render("Press H for High Scores", True, WHITE)
 
-        self.info_font = pygame.font.Font(None, 24)
+        self.info_font = get_font(None, 24)
 
-        # Music info
+        # Controls - rendered once, the text never changes
+        controls = [
+            "Controls:",
+            "Left Click - Shoot",
+            "R - Reload",
+            "1-5 - Switch Weapons",
+            "",
+            "M - Toggle Music",
+            "+/- - Volume Control",
+        ]
+        static_blits = [
+            (self.title_text, self.title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120))),
+            (self.subtitle_text, self.subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))),
+            (self.highscores_text, self.highscores_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))),
+        ]
+        y_offset = WINDOW_HEIGHT // 2 + 80
+        for line in controls:
+            if line:  # Skip empty lines for spacing
+                text = self.info_font.render(line, True, WHITE)
+                static_blits.append((text, text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))))
+            y_offset += 25
+
+        # Title, options and controls never change, so they are composed into one frame surface
+        self._static_frame = _build_static_frame(static_blits)
+
+        # FPS counter is re-rendered only when the displayed value changes
+        self._last_fps = -1
+        self._fps_text = None
+
+        # Music info, the rendered text is cached until the string changes
         self.music_info = "Loading music..."
+        self._music_info_shown = None
+        self._music_text = None
+        self._music_rect = None
         self.music_started = False
 
     def update(self, dt):
@@ -99,53 +180,87 @@ class MenuState(GameState):
 
     def render(self, screen, fps=0):
         """Render menu"""
-        screen.fill(BLACK)
-
-        # Title
-        title_rect = self.title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120))
-        screen.blit(self.title_text, title_rect)
-
-        # Subtitle
-        subtitle_rect = self.subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
-        screen.blit(self.subtitle_text, subtitle_rect)
-
-        # High scores option
-        highscores_rect = self.highscores_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-        screen.blit(self.highscores_text, highscores_rect)
-
-        # Controls
-        controls = [
-            "Controls:",
-            "Left Click - Shoot",
-            "R - Reload",
-            "1-5 - Switch Weapons",
-            "",
-            "M - Toggle Music",
-            "+/- - Volume Control",
-        ]
-
-        y_offset = WINDOW_HEIGHT // 2 + 80
-        for line in controls:
-            if line:  # Skip empty lines for spacing
-                text = self.info_font.render(line, True, WHITE)
-                text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-                screen.blit(text, text_rect)
-            y_offset += 25
+        # Background, title, options and controls
+        screen.blit(self._static_frame, (0, 0))
 
         # Music info
-        music_text = self.info_font.render(self.music_info, True, YELLOW)
-        music_rect = music_text.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
-        screen.blit(music_text, music_rect)
+        if self.music_info != self._music_info_shown:
+            self._music_info_shown = self.music_info
+            self._music_text = _render_text(self.info_font, self.music_info, YELLOW)
+            self._music_rect = self._music_text.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
+        screen.blit(self._music_text, self._music_rect)
 
         # FPS counter
-        fps_text = self.info_font.render(f"FPS: {int(fps)}", True, WHITE)
-        screen.blit(fps_text, (10, 10))
+        if int(fps) != self._last_fps:
+            self._last_fps = int(fps)
+            self._fps_text = _render_text(self.info_font, f"FPS: {self._last_fps}", WHITE)
+        screen.blit(self._fps_text, (10, 10))
 
 class GameplayState(GameState):
     """Main gameplay state with proper collision and animation systems"""
 
+    needs_clear = False  # The map viewport blit covers the whole screen
+
     def __init__(self):
         """Initialize gameplay state"""
+        # Game systems - the map and its pre-rendered surface are kept across runs
+        self.map_generator = MapGenerator()
+
+        # Initialize collision system with map generator
+        collision_init(self.map_generator)
+
+        # Broadphase grid over live zombies, rebuilt every update
+        self.zombie_grid = collisions.SpatialHash(cell_size=128)
+
+        # Sounds played during combat are loaded now rather than on their first shot or hit
+        sound_manager.prewarm(list(_WEAPON_SOUND.values()) + [
+            "effects_hit_flesh", "effects_reload", "effects_explosion",
+            "zombies_zombie_groan", "zombies_zombie_attack"
+        ])
+
+        # Largest camera position that keeps the view inside the map, and the offset that centers the player
+        self._cam_max_x = MAP_WIDTH * TILE_SIZE - WINDOW_WIDTH
+        self._cam_max_y = MAP_HEIGHT * TILE_SIZE - WINDOW_HEIGHT
+        self._half_window_w = WINDOW_WIDTH // 2
+        self._half_window_h = WINDOW_HEIGHT // 2
+
+        # Per-run state (player, zombies, items, score, ...)
+        self.reset()
+
+        # Debug flags
+        self.show_debug = False
+
+        # Keydown dispatch table, handlers return the next state name or None.
+        # Only ESC changes state, every other handler must return None
+        self._keymap = {
+            pygame.K_ESCAPE: lambda: "menu",  # Changed from "pause" to "menu"
+            pygame.K_r: self._reload,
+            pygame.K_q: self._cycle_weapons_backward,
+            pygame.K_e: self._cycle_weapons_forward,
+            pygame.K_m: self._stop_music,
+            pygame.K_F2: self._spawn_all_item_types,  # Debug: Spawn all item types in front of player
+            pygame.K_F3: self._toggle_debug,
+            pygame.K_F4: self._spawn_debug_zombie,  # Debug: Spawn zombie near player
+        }
+        for slot, key in enumerate((pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5)):
+            self._keymap[key] = partial(self._switch_weapon, slot)
+
+        # Debug overlay font and static labels, only the values are rendered per frame
+        self._debug_font = get_font(None, 20)
+        self._debug_labels = [
+            (_render_text(self._debug_font, label, YELLOW), value_format)
+            for label, value_format in (
+                ("Player: ", "({0[0]}, {0[1]})"),
+                ("Camera: ", "({0[0]}, {0[1]})"),
+                ("Zombies: ", "{0}"),
+                ("Active Animations: ", "{0}"),
+                ("Aim Angle: ", "{0:.1f}°"),
+            )
+        ]
+        self._dbg_cache = {}  # line index -> (last value, rendered surface)
+
+    def reset(self):
+        """Start a new run on the existing map"""
         # Add GameUI system
         from systems.ui import GameUI
         self.ui = GameUI()
@@ -155,12 +270,6 @@ class GameplayState(GameState):
         map_center_y = (MAP_HEIGHT * TILE_SIZE) // 2
         self.player = Player(map_center_x, map_center_y)
 
-        # Game systems
-        self.map_generator = MapGenerator()
-
-        # Initialize collision system with map generator
-        collision_init(self.map_generator)
-
         self.enemy_system = EnemySpawner(self.map_generator)
         self.item_spawner = ItemSpawner(self.map_generator)
         self.item_spawner.ui = self.ui  # Connect UI for pickup notifications
@@ -168,17 +277,27 @@ class GameplayState(GameState):
 
         self.camera_y = 0
         self.camera_x = 0
+        self.camera_offset = (0, 0)
 
         # Game state
         self.paused = False
         self.score = 0
 
-        # Debug flags
-        self.show_debug = False
-
         # Music
         self.music_started = False
 
+        # Set when the run is left, so the next on_enter starts a new one
+        self._needs_reset = False
+
+    def on_enter(self):
+        """Start a new run when re-entering after a previous one"""
+        if self._needs_reset:
+            self.reset()
+
+    def on_exit(self):
+        """Mark the run as finished, the score stays readable until the next on_enter"""
+        self._needs_reset = True
+
     def update(self, dt):
         """Update gameplay state"""
         if self.paused:
@@ -201,11 +320,14 @@ class GameplayState(GameState):
 
         self.player.update(dt, self.map_generator)
         self.enemy_system.update(dt, self.player.x, self.player.y)
+        self.zombie_grid.rebuild(self.enemy_system.zombies)
         self.item_spawner.update(dt)
 
-        animation_system.update(dt)
+        if animation_system.effects:  # Nothing to do on frames without active effects
+            animation_system.update(dt)
 
-        self._handle_bullet_update(dt)
+        if self.bullets:  # Skip the bullet pass entirely on frames without shots in flight
+            self._handle_bullet_update(dt)
         self._update_camera()
 
         # Check collisions and handle game over
@@ -218,27 +340,9 @@ class GameplayState(GameState):
     def handle_event(self, event):
         """Handle gameplay events"""
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                return "menu"  # Changed from "pause" to "menu"
-            elif event.key == pygame.K_r:
-                sound_manager.play_sound("effects_reload")
-                self.player.reload()
-            elif event.key == pygame.K_q:
-                self.player.cycle_weapons_backward()
-            elif event.key == pygame.K_e:
-                self.player.cycle_weapons_forward()
-            elif event.key == pygame.K_m:
-                sound_manager.stop_music()
-            elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5]:
-                slot = event.key - pygame.K_1
-                self.player.switch_weapon(slot)
-            elif event.key == pygame.K_F2:
-                self._spawn_all_item_types()  # Debug: Spawn all item types in front of player
-            elif event.key == pygame.K_F3:
-                self.show_debug = not self.show_debug
-            elif event.key == pygame.K_F4:
-                self._spawn_debug_zombie()  # Debug: Spawn zombie near player
-
+            handler = self._keymap.get(event.key)
+            if handler:
+                return handler()
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -246,27 +350,58 @@ class GameplayState(GameState):
 
         elif event.type == pygame.MOUSEMOTION:
             # Update player aim
-            camera_offset = (self.camera_x, self.camera_y)
-            self.player.update_aim(event.pos, camera_offset)
+            self.player.update_aim(event.pos, self.camera_offset)
 
         return None
 
 
+    def _reload(self):
+        """Reload the current weapon"""
+        sound_manager.play_sound("effects_reload")
+        self.player.reload()
+
+    def _switch_weapon(self, slot):
+        """Switch to the weapon in the given slot"""
+        self.player.switch_weapon(slot)
+
+    def _cycle_weapons_forward(self):
+        """Switch to the next weapon"""
+        self.player.cycle_weapons_forward()
+
+    def _cycle_weapons_backward(self):
+        """Switch to the previous weapon"""
+        self.player.cycle_weapons_backward()
+
+    def _stop_music(self):
+        """Stop the background music"""
+        sound_manager.stop_music()
+
+    @property
+    def shows_fps(self):
+        """The HUD only draws the fps counter while its debug display is on"""
+        return self.ui.show_debug
+
+    def _toggle_debug(self):
+        """Toggle the debug overlay"""
+        self.show_debug = not self.show_debug
+
     def render(self, screen, fps=0):
         """Render gameplay"""
-        screen.fill(BLACK)
-
         # Calculate camera offset
-        camera_offset = (self.camera_x, self.camera_y)
+        camera_offset = self.camera_offset
         self.map_generator.render(screen, camera_offset)
         self.item_spawner.render(screen, camera_offset)
         self.player.render(screen, camera_offset)
         self.enemy_system.render(screen, camera_offset)
 
+        # Only draw bullets inside the viewport, the margin keeps trails from popping at the edges
+        view_rect = pygame.Rect(self.camera_x - 20, self.camera_y - 20, WINDOW_WIDTH + 40, WINDOW_HEIGHT + 40)
         for bullet in self.bullets:
-            bullet.render(screen, camera_offset)
+            if view_rect.colliderect(bullet.rect):
+                bullet.render(screen, camera_offset)
 
-        animation_system.render(screen, camera_offset)
+        if animation_system.effects:
+            animation_system.render(screen, camera_offset)
 
         self._render_ui(screen, fps)
         if self.show_debug:
@@ -274,25 +409,32 @@ class GameplayState(GameState):
 
     def _update_camera(self):
         """Update camera to follow player"""
-        # Center camera on player
-        self.camera_x = self.player.x - WINDOW_WIDTH // 2
-        self.camera_y = self.player.y - WINDOW_HEIGHT // 2
-
-        # Clamp camera to map bounds
-        map_width = MAP_WIDTH * TILE_SIZE
-        map_height = MAP_HEIGHT * TILE_SIZE
+        # Center camera on player, clamped to map bounds
+        self.camera_x = max(0, min(self.player.x - self._half_window_w, self._cam_max_x))
+        self.camera_y = max(0, min(self.player.y - self._half_window_h, self._cam_max_y))
 
-        self.camera_x = max(0, min(self.camera_x, map_width - WINDOW_WIDTH))
-        self.camera_y = max(0, min(self.camera_y, map_height - WINDOW_HEIGHT))
+        # Whole-pixel offset shared by every render call and aim update until the next camera update
+        self.camera_offset = (int(self.camera_x), int(self.camera_y))
 
     def _handle_bullet_update(self, dt):
-        for bullet in self.bullets[:]:  # Create copy to avoid modification during iteration
-            bullet.update(dt, self.map_generator)
-
-            # Check collision with zombies
+        bullets = self.bullets
+        # Bind lookups used for every bullet once per frame
+        map_generator = self.map_generator
+        query_zombies = self.zombie_grid.query
+        entity_collision = collisions.check_entity_collision
+        zombies_killed = False
+        i = 0
+        while i < len(bullets):  # Iterate in place, removed bullets are swap-popped
+            bullet = bullets[i]
+            bullet.update(dt, map_generator)
+
+            # Check collision with zombies near the bullet only
             hit_zombie = None
-            for zombie in self.enemy_system.zombies[:]:
-                if collisions.check_entity_collision(bullet, zombie):
+            nearby_zombies = query_zombies(bullet.x, bullet.y, bullet.width, bullet.height)
+            for zombie in nearby_zombies:
+                if zombie.is_dead():
+                    continue  # Already killed this frame
+                if entity_collision(bullet, zombie):
                     # Add blood effect when zombie is hit - USE ANIMATION SYSTEM
                     blood_x = zombie.x + zombie.width / 2
                     blood_y = zombie.y + zombie.height / 2
@@ -302,7 +444,7 @@ class GameplayState(GameState):
                     sound_manager.play_sound("effects_hit_flesh")
 
                     if zombie.take_damage(bullet.damage):
-                        self.enemy_system.zombies.remove(zombie)
+                        zombies_killed = True  # Removed in one pass below
                         # Use zombie-specific score value
                         self.score += zombie.get_score_value()
                     hit_zombie = zombie
@@ -310,53 +452,52 @@ class GameplayState(GameState):
 
             # Remove bullet if it hit something or expired
             if hit_zombie or bullet.is_expired():
-                if bullet in self.bullets:
-                    self.bullets.remove(bullet)
+                # Bullet order doesn't matter, so fill the slot with the last bullet
+                bullets[i] = bullets[-1]
+                bullets.pop()
 
                 # Handle explosive bullets hitting zombies
                 if bullet.is_explosive and hit_zombie:
                     explosion_data = bullet.explode()
                     if explosion_data:
                         self._handle_explosion(explosion_data)
+                        zombies_killed = True
 
                 # Handle explosive bullets hitting walls
                 if bullet.is_explosive and bullet.hit_wall and bullet.wall_hit_explosion:
                     self._handle_explosion(bullet.wall_hit_explosion)
+                    zombies_killed = True
+                continue
+            i += 1
+
+        if zombies_killed:
+            self._remove_dead_zombies()
+
+    def _remove_dead_zombies(self):
+        """Drop killed zombies in a single pass, keeping the list object and render order"""
+        zombies = self.enemy_system.zombies
+        write = 0
+        for zombie in zombies:
+            if not zombie.is_dead():
+                zombies[write] = zombie
+                write += 1
+        del zombies[write:]
 
     def _handle_player_shoot(self):
-        """Handle player shooting"""
-        if pygame.mouse.get_pressed()[0]:  # Left mouse button
-            projectiles = self.player.shoot()
-            if projectiles:
-                # Add muzzle flash animation
-                self._add_muzzle_flash_animation()
-
-                # Play weapon sound based on weapon type
-                current_weapon = self.player.get_current_weapon()
-                if current_weapon:
-                    weapon_type = current_weapon.get_weapon_type()
-
-                    # Map weapon types to actual sound file names (without 'weapons_' prefix)
-                    sound_mapping = {
-                        "pistol": "pistol",
-                        "shotgun": "shotgun",
-                        "assault_rifle": "assault",
-                        "sniper_rifle": "sniper",
-                        "bazooka": "bazooka_fire"
-                    }
-
-                    # Play the corresponding sound with 'weapons' category
-                    sound_name = sound_mapping.get(weapon_type)
-                    if sound_name:
-                        from systems.audio import sound_manager
-                        sound_manager.play_sound(f"weapons_{sound_name}", volume=0.4)
-
-                if isinstance(projectiles, list):
-                    # Multiple projectiles (shotgun)
-                    self.bullets.extend(projectiles)
-                else:
-                    # Single projectile
-                    self.bullets.append(projectiles)
+        """Handle player shooting, callers have already checked the left mouse button"""
+        projectiles = self.player.shoot()
+        if projectiles:
+            # Add muzzle flash animation
+            self._add_muzzle_flash_animation()
+
+            # Play weapon sound based on weapon type
+            current_weapon = self.player.get_current_weapon()
+            if current_weapon:
+                sound_name = _WEAPON_SOUND.get(current_weapon.get_weapon_type())
+                if sound_name:
+                    sound_manager.play_sound(sound_name, volume=0.4)
+
+            self.bullets.extend(projectiles)
 
     def _add_muzzle_flash_animation(self):
         """Add muzzle flash animation at weapon position"""
@@ -387,8 +528,9 @@ class GameplayState(GameState):
         # Check if we hit any zombies
         zombies = self.enemy_system.get_zombies()
         for zombie in zombies:
-            distance = math.sqrt((zombie.x - hit_x) ** 2 + (zombie.y - hit_y) ** 2)
-            if distance < 50:  # Hit radius
+            dx = zombie.x - hit_x
+            dy = zombie.y - hit_y
+            if dx * dx + dy * dy < 50 * 50:  # Hit radius, compared squared
                 # Add blood splatter animation
                 animation_system.add_effect('blood_splatter', zombie.x, zombie.y, 1.0)
 
@@ -444,28 +586,30 @@ class GameplayState(GameState):
             self.ui.show_info_message(message, 2.0)
 
         # Visual effect at spawn location
-        from systems.animation import animation_system
         animation_system.add_effect('explosion', spawn_x, spawn_y, 0.3, size=0.3)
 
     def _check_collisions(self):
         """Check collisions between game entities using proper collision system"""
-        zombies = self.enemy_system.get_zombies()
+        player = self.player
+        nearby_zombies = self.zombie_grid.query(player.x, player.y, player.width, player.height)
 
-        for zombie in zombies:
-            if check_entity_collision(self.player, zombie):
+        for zombie in nearby_zombies:
+            if zombie.is_dead():
+                continue
+            if check_entity_collision(player, zombie):
                 # Zombie attacks player - only add blood effect if attack succeeds
-                if zombie.attack(self.player):
+                if zombie.attack(player):
                     # Add blood splatter when player is actually hit
-                    animation_system.add_effect('blood_splatter', self.player.x, self.player.y, 0.8)
+                    animation_system.add_effect('blood_splatter', player.x, player.y, 0.8)
 
                     # Play hit flesh sound when zombie hits player
                     sound_manager.play_sound("effects_hit_flesh")
 
                 # Check if player died AFTER the attack
-                if self.player.is_dead():
+                if player.is_dead():
                     return "game_over"
 
-        picked_items = self.item_spawner.check_pickups(self.player)
+        picked_items = self.item_spawner.check_pickups(player)
         for item in picked_items:
             animation_system.add_effect('explosion', item.x, item.y, 0.5, size=0.5)
 
@@ -483,20 +627,26 @@ class GameplayState(GameState):
 
     def _render_debug_info(self, screen, fps, camera_offset):
         """Render debug information"""
-        font = pygame.font.Font(None, 20)
-        debug_info = [
-            f"Player: ({int(self.player.x)}, {int(self.player.y)})",
-            f"Camera: ({int(camera_offset[0])}, {int(camera_offset[1])})",
-            f"Zombies: {len(self.enemy_system.get_zombies())}",
-            f"Active Animations: {len(animation_system.effects)}",
-            f"Aim Angle: {math.degrees(self.player.aim_angle):.1f}°"
-        ]
-
-        y_offset = WINDOW_HEIGHT - len(debug_info) * 25 - 10
-        for info in debug_info:
-            text = font.render(info, True, YELLOW)
-            screen.blit(text, (10, y_offset))
+        debug_values = (
+            (int(self.player.x), int(self.player.y)),
+            camera_offset,
+            len(self.enemy_system.get_zombies()),
+            len(animation_system.effects),
+            round(math.degrees(self.player.aim_angle), 1)
+        )
+
+        y_offset = WINDOW_HEIGHT - len(debug_values) * 25 - 10
+        blits = []
+        for line, ((label, value_format), value) in enumerate(zip(self._debug_labels, debug_values)):
+            # Re-render a value only when it changed since the last frame
+            cached = self._dbg_cache.get(line)
+            if cached is None or cached[0] != value:
+                cached = (value, _render_text(self._debug_font, value_format.format(value), YELLOW))
+                self._dbg_cache[line] = cached
+            blits.append((label, (10, y_offset)))
+            blits.append((cached[1], (10 + label.get_width(), y_offset)))
             y_offset += 25
+        screen.blits(blits, doreturn=False)
 
     def _handle_explosion(self, explosion_data):
         """Handle explosive damage with visual effects"""
@@ -508,18 +658,24 @@ class GameplayState(GameState):
         animation_system.add_effect('explosion', explosion_x, explosion_y, 0.6, radius=explosion_radius)
 
         # Play explosion sound
-        from systems.audio import sound_manager
         sound_manager.play_sound("effects_explosion")
 
-        # Damage all zombies in explosion radius
-        import math
-        for zombie in self.enemy_system.zombies[:]:
+        # Damage all zombies in explosion radius, only visiting grid cells the blast can reach
+        radius_sq = explosion_radius * explosion_radius
+        nearby_zombies = self.zombie_grid.query(explosion_x - explosion_radius, explosion_y - explosion_radius,
+                                                explosion_radius * 2, explosion_radius * 2)
+        for zombie in nearby_zombies:
+            if zombie.is_dead():
+                continue  # Already killed this frame
             zombie_center_x = zombie.x + zombie.width / 2
             zombie_center_y = zombie.y + zombie.height / 2
 
-            distance = math.sqrt((zombie_center_x - explosion_x) ** 2 + (zombie_center_y - explosion_y) ** 2)
+            dx = zombie_center_x - explosion_x
+            dy = zombie_center_y - explosion_y
+            distance_sq = dx * dx + dy * dy
 
-            if distance <= explosion_radius:
+            if distance_sq <= radius_sq:
+                distance = math.sqrt(distance_sq)  # Only needed for damage falloff
                 # Add blood effect for each hit zombie
                 animation_system.add_effect('blood_splatter', zombie_center_x, zombie_center_y, 0.8)
 
@@ -528,7 +684,7 @@ class GameplayState(GameState):
                 actual_damage = int(explosion_damage * damage_multiplier)
 
                 if zombie.take_damage(actual_damage):
-                    self.enemy_system.zombies.remove(zombie)
+                    # Dead zombies are removed by _remove_dead_zombies after the bullet pass
                     # Use zombie-specific score value with bonus for explosive kills
                     self.score += zombie.get_score_value() + 5  # +5 bonus for explosive kills
 
@@ -548,17 +704,20 @@ class GameplayState(GameState):
         radius = 100  # Distance from player
         item_count = len(all_item_types)
         angle_step = math.pi / (item_count + 1)  # Distribute items in a semi-circle
+        cos, sin = math.cos, math.sin  # Local lookups for the loop below
+        weapon_types = ItemFactory._weapon_types
+        weapon_spread_center = len(weapon_types) / 2
         for i, item_type in enumerate(all_item_types):
             angle = aim_angle - math.pi/2 + angle_step * (i + 1)
-            x = player_x + radius * math.cos(angle)
-            y = player_y + radius * math.sin(angle)
+            x = player_x + radius * cos(angle)
+            y = player_y + radius * sin(angle)
 
             if item_type == "weapon":
                 # Spawn one of each weapon type
-                for weapon_type in ItemFactory._weapon_types:
-                    weapon_angle = angle + (0.1 * (ItemFactory._weapon_types.index(weapon_type) - len(ItemFactory._weapon_types)/2))
-                    weapon_x = player_x + (radius + 30) * math.cos(weapon_angle)
-                    weapon_y = player_y + (radius + 30) * math.sin(weapon_angle)
+                for weapon_index, weapon_type in enumerate(weapon_types):
+                    weapon_angle = angle + (0.1 * (weapon_index - weapon_spread_center))
+                    weapon_x = player_x + (radius + 30) * cos(weapon_angle)
+                    weapon_y = player_y + (radius + 30) * sin(weapon_angle)
                     self.item_spawner.spawn_weapon(weapon_type, (weapon_x, weapon_y))
             else:
                 self.item_spawner.spawn_specific_item(item_type, (x, y))
@@ -572,11 +731,18 @@ class PauseState(GameState):
 
     def __init__(self):
         """Initialize pause state"""
-        self.font = pygame.font.Font(None, 74)
-        self.title_text = self.font.render("PAUSED", True, WHITE)
+        self.font = get_font(None, 74)
+        self.title_text = _render_text(self.font, "PAUSED", WHITE)
+
+        self.subtitle_font = get_font(None, 36)
+        self.subtitle_text = _render_text(self.subtitle_font, "Press ESC to Continue", WHITE)
 
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.subtitle_text = self.subtitle_font.render("Press ESC to Continue", True, WHITE)
+        # Semi-transparent overlay, built once and reused every frame
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            self.overlay = self.overlay.convert()
+        self.overlay.set_alpha(128)
+        self.overlay.fill(BLACK)
 
     def update(self, dt):
         """Update pause state"""
@@ -594,10 +760,7 @@ class PauseState(GameState):
     def render(self, screen, fps=0):
         """Render pause menu"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.overlay, (0, 0))
 
         # Title
         title_rect = self.title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
@@ -611,26 +774,35 @@ class PauseState(GameState):
 class GameOverState(GameState):
     """Game over state with name input"""
 
+    needs_clear = False  # Fills its own background
+
     def __init__(self, score=0):
         """Initialize game over state"""
-        self.score = score
-        self.font = pygame.font.Font(None, 74)
-        self.title_text = self.font.render("GAME OVER", True, RED)
+        self.font = get_font(None, 74)
+        self.title_text = _render_text(self.font, "GAME OVER", RED)
 
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.input_font = pygame.font.Font(None, 32)
-        self.score_text = self.subtitle_font.render(f"Final Score: {score}", True, WHITE)
+        self.subtitle_font = get_font(None, 36)
+        self.input_font = get_font(None, 32)
 
-        # Name input
+        # Instructions
+        self.name_prompt = _render_text(self.subtitle_font, "Enter your name:", WHITE)
+        self.restart_text = _render_text(self.input_font, "Press ENTER to save, ESC for menu", GRAY)
+
+        self.on_enter(score)
+
+    def on_enter(self, score=0):
+        """Show the given final score and clear the name input"""
+        self.score = score
+        self.score_text = _render_text(self.subtitle_font, f"Final Score: {score}", WHITE)
+
+        # Name input - characters are kept in a list and joined only when they change
+        self._name_buf = []
         self.player_name = ""
+        self._input_surfaces = None  # (without cursor, with cursor), rebuilt when the name changes
         self.input_active = True
         self.cursor_visible = True
         self.cursor_timer = 0
 
-        # Instructions
-        self.name_prompt = self.subtitle_font.render("Enter your name:", True, WHITE)
-        self.restart_text = self.input_font.render("Press ENTER to save, ESC for menu", True, GRAY)
-
     def update(self, dt):
         """Update game over state"""
         # Cursor blinking
@@ -650,21 +822,32 @@ class GameOverState(GameState):
                 return "menu"
             elif event.key == pygame.K_BACKSPACE and self.input_active:
                 # Remove last character
-                self.player_name = self.player_name[:-1]
+                if self._name_buf:
+                    self._name_buf.pop()
+                    self._name_changed()
             elif event.key == pygame.K_SPACE and self.input_active:
                 # Add space
-                if len(self.player_name) < 20:
-                    self.player_name += " "
+                if len(self._name_buf) < 20:
+                    self._name_buf.append(" ")
+                    self._name_changed()
 
         elif event.type == pygame.TEXTINPUT and self.input_active:
             # Add typed character
-            if len(self.player_name) < 20 and event.text.isprintable():
-                self.player_name += event.text
+            if len(self._name_buf) < 20 and event.text.isprintable():
+                self._name_buf.extend(event.text)
+                self._name_changed()
 
         return None
 
+    def _name_changed(self):
+        """Rebuild the player name from the input buffer and mark the input text for re-render"""
+        self.player_name = "".join(self._name_buf)
+        self._input_surfaces = None
+
     def _save_score(self):
         """Save score to file"""
+        global _HIGH_SCORES_CACHE
+        import heapq
         import json
         import os
         from datetime import datetime
@@ -685,14 +868,16 @@ class GameOverState(GameState):
             }
             scores.append(new_score)
 
-            # Sort by score and keep top 10
-            scores.sort(key=lambda x: x["score"], reverse=True)
-            scores = scores[:10]
+            # Keep top 10 by score without sorting the whole list
+            scores = heapq.nlargest(10, scores, key=lambda x: x["score"])
 
             # Save to file
             with open("high_scores.json", "w") as f:
                 json.dump(scores, f, indent=2)
 
+            # Drop cached scores so the next high scores screen rereads the file
+            _HIGH_SCORES_CACHE = None
+
             print(f"Score saved: {new_score}")
         except Exception as e:
             print(f"Error saving score: {e}")
@@ -714,11 +899,10 @@ class GameOverState(GameState):
         screen.blit(self.name_prompt, prompt_rect)
 
         # Name input field - POUZE KURZOR BEZ OBDÉLNÍKU
-        input_text = self.player_name
-        if self.input_active and self.cursor_visible:
-            input_text += "|"
-
-        input_surface = self.input_font.render(input_text, True, WHITE)
+        if self._input_surfaces is None:
+            self._input_surfaces = (_render_text(self.input_font, self.player_name, WHITE),
+                                    _render_text(self.input_font, self.player_name + "|", WHITE))
+        input_surface = self._input_surfaces[self.input_active and self.cursor_visible]
         input_rect = input_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
 
         # Render just the text with cursor, no background rectangle
@@ -731,56 +915,51 @@ class GameOverState(GameState):
 class HighScoresState(GameState):
     """High scores display state"""
 
+    needs_clear = False  # The static frame covers the whole screen
+    shows_fps = True
+
     def __init__(self):
         """Initialize high scores state"""
-        self.font = pygame.font.Font(None, 74)
-        self.title_text = self.font.render("HIGH SCORES", True, WHITE)
+        self.font = get_font(None, 74)
+        self.title_text = _render_text(self.font, "HIGH SCORES", WHITE)
+
+        self.subtitle_font = get_font(None, 36)
+        self.score_font = get_font(None, 28)
+        self.info_font = get_font(None, 24)
 
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.score_font = pygame.font.Font(None, 28)
-        self.info_font = pygame.font.Font(None, 24)
+        self.back_text = _render_text(self.info_font, "Press ESC to return to menu", GRAY)
 
-        self.back_text = self.info_font.render("Press ESC to return to menu", True, GRAY)
+        # FPS counter is re-rendered only when the displayed value changes
+        self._last_fps = -1
+        self._fps_text = None
 
         # Load high scores
         self.high_scores = self._load_high_scores()
+        self._rebuild_cache()
 
         # Music info
         self.music_started = True
 
     def _load_high_scores(self):
-        """Load high scores from file"""
+        """Load high scores from file, reusing the cached list while the file is unchanged"""
+        global _HIGH_SCORES_CACHE
         import json
+        import os
         try:
+            mtime = os.path.getmtime("high_scores.json")
+            if _HIGH_SCORES_CACHE and _HIGH_SCORES_CACHE[0] == mtime:
+                return _HIGH_SCORES_CACHE[1]
+
             with open("high_scores.json", "r") as f:
-                scores = json.load(f)
-                return scores[:10]  # Top 10 scores
+                scores = json.load(f)[:10]  # Top 10 scores
+            _HIGH_SCORES_CACHE = (mtime, scores)
+            return scores
         except (FileNotFoundError, json.JSONDecodeError):
             return []  # Return empty list if file doesn't exist or is corrupted
 
-    def update(self, dt):
-        """Update high scores state"""
-        # Start menu music
-        if not self.music_started:
-            sound_manager.play_music("music_menu")
-            self.music_started = True
-
-    def handle_event(self, event):
-        """Handle high scores events"""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                return "menu"
-        return None
-
-    def render(self, screen, fps=0):
-        """Render high scores"""
-        screen.fill(BLACK)
-
-        # Title
-        title_rect = self.title_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
-        screen.blit(self.title_text, title_rect)
-
-        # High scores list
+    def _rebuild_cache(self):
+        """Compose the title, score rows (or the empty message) and back text into the static frame"""
+        static_blits = [(self.title_text, self.title_text.get_rect(center=(WINDOW_WIDTH // 2, 80)))]
         if self.high_scores:
             y_offset = 160
             for i, score_entry in enumerate(self.high_scores):
@@ -791,86 +970,144 @@ class HighScoresState(GameState):
 
                 # Rank and name
                 rank_text = f"{rank:2d}. {name[:15]:<15}"  # Limit name length and pad
-                rank_surface = self.score_font.render(rank_text, True, WHITE)
+                rank_surface = _render_text(self.score_font, rank_text, WHITE)
 
                 # Score
                 score_text = f"{score:>8,}"  # Right-align score with thousands separator
-                score_surface = self.score_font.render(score_text, True, YELLOW)
+                score_surface = _render_text(self.score_font, score_text, YELLOW)
 
                 # Date (smaller)
-                date_surface = self.info_font.render(date, True, GRAY)
+                date_surface = _render_text(self.info_font, date, GRAY)
 
                 # Position elements
                 rank_rect = rank_surface.get_rect(left=WINDOW_WIDTH // 2 - 200, top=y_offset)
                 score_rect = score_surface.get_rect(left=WINDOW_WIDTH // 2 + 20, top=y_offset)
                 date_rect = date_surface.get_rect(left=WINDOW_WIDTH // 2 + 150, top=y_offset + 5)
 
-                screen.blit(rank_surface, rank_rect)
-                screen.blit(score_surface, score_rect)
-                screen.blit(date_surface, date_rect)
+                static_blits.append((rank_surface, rank_rect))
+                static_blits.append((score_surface, score_rect))
+                static_blits.append((date_surface, date_rect))
 
                 y_offset += 35
         else:
             # No scores yet
-            no_scores_text = self.subtitle_font.render("No high scores yet!", True, GRAY)
+            no_scores_text = _render_text(self.subtitle_font, "No high scores yet!", GRAY)
             no_scores_rect = no_scores_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-            screen.blit(no_scores_text, no_scores_rect)
+            static_blits.append((no_scores_text, no_scores_rect))
+
+        static_blits.append((self.back_text, self.back_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))))
+        self._static_frame = _build_static_frame(static_blits)
+
+    def on_enter(self):
+        """Reload high scores, re-rendering only if the file changed since the last visit"""
+        high_scores = self._load_high_scores()
+        if high_scores is not self.high_scores:
+            self.high_scores = high_scores
+            self._rebuild_cache()
+
+    def update(self, dt):
+        """Update high scores state"""
+        # Start menu music
+        if not self.music_started:
+            sound_manager.play_music("music_menu")
+            self.music_started = True
+
+    def handle_event(self, event):
+        """Handle high scores events"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return "menu"
+        return None
 
-        # Back instruction
-        back_rect = self.back_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
-        screen.blit(self.back_text, back_rect)
+    def render(self, screen, fps=0):
+        """Render high scores"""
+        # Background, title, score rows and back instruction, composed in _rebuild_cache
+        screen.blit(self._static_frame, (0, 0))
 
         # FPS counter
-        fps_text = self.info_font.render(f"FPS: {int(fps)}", True, WHITE)
-        screen.blit(fps_text, (10, 10))
+        if int(fps) != self._last_fps:
+            self._last_fps = int(fps)
+            self._fps_text = _render_text(self.info_font, f"FPS: {self._last_fps}", WHITE)
+        screen.blit(self._fps_text, (10, 10))
 
 
 class GameStateManager:
     """Manager for handling game state transitions"""
 
+    # State names _change_state accepts
+    STATE_NAMES = ("menu", "gameplay", "game_over", "high_scores")
+
     def __init__(self):
         """Initialize game state manager"""
-        self.states = {
-            "menu": MenuState(),
-            "gameplay": None,  # Will be created when needed
-            "game_over": None,  # Will be created when needed
-            "high_scores": None  # Will be created when needed
-        }
+        self.menu = MenuState()
+        self.gameplay = None  # Will be created when needed
+        self.game_over = None  # Will be created when needed
+        self.high_scores = None  # Will be created when needed
+
+        self.active = self.menu  # State receiving events, updates and render calls
         self.current_state = "menu"
         self.previous_state = None
 
+    @property
+    def needs_clear(self):
+        """Whether the screen has to be cleared before rendering the active state"""
+        return self.active is None or self.active.needs_clear
+
+    @property
+    def shows_fps(self):
+        """Whether the active state draws the fps value"""
+        return self.active is not None and self.active.shows_fps
+
     def handle_event(self, event):
         """Handle events and state transitions"""
-        if self.current_state in self.states and self.states[self.current_state]:
-            next_state = self.states[self.current_state].handle_event(event)
+        if self.active:
+            next_state = self.active.handle_event(event)
             if next_state:
                 self._change_state(next_state)
 
     def update(self, dt):
         """Update current state"""
-        if self.current_state in self.states and self.states[self.current_state]:
-            result = self.states[self.current_state].update(dt)
+        if self.active:
+            result = self.active.update(dt)
             if result == "game_over":
                 self._change_state("game_over")
 
     def render(self, screen, fps=0):
         """Render current state"""
-        if self.current_state in self.states and self.states[self.current_state]:
-            self.states[self.current_state].render(screen, fps)
+        if self.active:
+            self.active.render(screen, fps)
 
     def _change_state(self, new_state):
         """Change to a new state"""
+        # Anything that isn't a state name is ignored, the current state keeps running
+        if new_state not in self.STATE_NAMES:
+            print(f"Ignoring unknown state: {new_state!r}")
+            return
+
+        if self.active:
+            self.active.on_exit()
+
         self.previous_state = self.current_state
         self.current_state = new_state
 
-        # Create state instances as needed
-        if new_state == "gameplay":
-            self.states["gameplay"] = GameplayState()
+        # Create state instances as needed, then reuse them
+        if new_state == "menu":
+            self.active = self.menu
+            self.menu.on_enter()
+        elif new_state == "gameplay":
+            if self.gameplay is None:
+                self.gameplay = GameplayState()
+            self.active = self.gameplay
+            self.gameplay.on_enter()
         elif new_state == "game_over":
+            if self.game_over is None:
+                self.game_over = GameOverState()
             # Get score from gameplay state if available
-            score = 0
-            if self.states["gameplay"]:
-                score = self.states["gameplay"].score
-            self.states["game_over"] = GameOverState(score)
+            score = self.gameplay.score if self.gameplay else 0
+            self.active = self.game_over
+            self.game_over.on_enter(score)
         elif new_state == "high_scores":
-            self.states["high_scores"] = HighScoresState()
+            if self.high_scores is None:
+                self.high_scores = HighScoresState()
+            self.active = self.high_scores
+            self.high_scores.on_enter()
@@ -1,4 +1,5 @@
 import random
+from collections import Counter
 import pygame
 from utils.constants import (
     TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, EDGE_THICKNESS,
@@ -8,6 +9,12 @@ from utils.constants import (
 from utils.sprite_loader import get_sprite
 from game.building_templates import SMALL_BUILDINGS, MEDIUM_BUILDINGS, LARGE_BUILDINGS, ALL_BUILDINGS
 
+# Grass, objects, and wood (floor inside buildings) are walkable
+WALKABLE_TILES = frozenset((TILE_GRASS, TILE_OBJECT, TILE_WOOD))
+
+# Building template values and the tiles they place, 0 keeps the existing tile
+_TEMPLATE_TILES = {1: TILE_WALL, 2: TILE_WOOD}
+
 class MapGenerator:
     """Map generator for the game"""
 
@@ -19,9 +26,23 @@ class MapGenerator:
         # Generate the map
         self._generate_map()
 
+        # Walkability per tile, so is_walkable is a single lookup instead of a tile type comparison chain
+        self.walkable_grid = [[tile in WALKABLE_TILES for tile in row] for row in self.map_data]
+
+        # Tile coordinates of every walkable tile, for sampling spawn positions without retries
+        self.walkable_tiles = [
+            (x, y)
+            for y in range(MAP_HEIGHT)
+            for x in range(MAP_WIDTH)
+            if self.walkable_grid[y][x]
+        ]
+
         # Create a surface for the map
         self.map_surface = self._create_map_surface()
 
+        # Source rect for the per-frame viewport blit, moved in place instead of reallocated
+        self._view_rect = pygame.Rect(0, 0, 0, 0)
+
     def _generate_map(self):
         """Generate the map with grass, objects, walls, and wood"""
         # Step 1: Fill the entire map with grass (already done in initialization)
@@ -37,35 +58,42 @@ class MapGenerator:
 
     def _add_forest_edge(self):
         """Add a dense forest around the edges of the map"""
+        map_data = self.map_data
+        rand = random.random  # Called once or twice per edge tile
+
         # Add objects along the top and bottom edges
         for x in range(MAP_WIDTH):
             for y in range(EDGE_THICKNESS):
                 # Top edge
-                if random.random() < 0.4:  # 40% chance for an object
-                    self.map_data[y][x] = TILE_OBJECT
+                if rand() < 0.4:  # 40% chance for an object
+                    map_data[y][x] = TILE_OBJECT
 
                 # Bottom edge
-                if random.random() < 0.4:
-                    self.map_data[MAP_HEIGHT - 1 - y][x] = TILE_OBJECT
+                if rand() < 0.4:
+                    map_data[MAP_HEIGHT - 1 - y][x] = TILE_OBJECT
 
         # Add objects along the left and right edges
         for y in range(MAP_HEIGHT):
+            row = map_data[y]
             for x in range(EDGE_THICKNESS):
                 # Left edge
-                if random.random() < 0.4:
-                    self.map_data[y][x] = TILE_OBJECT
+                if rand() < 0.4:
+                    row[x] = TILE_OBJECT
 
                 # Right edge
-                if random.random() < 0.4:
-                    self.map_data[y][MAP_WIDTH - 1 - x] = TILE_OBJECT
+                if rand() < 0.4:
+                    row[MAP_WIDTH - 1 - x] = TILE_OBJECT
 
     def _add_buildings(self):
         """Add buildings to the map using templates from building_templates.py"""
         # Determine how many buildings to add
         num_buildings = random.randint(MIN_BUILDINGS, MAX_BUILDINGS)
 
-        # Keep track of building positions to prevent overlapping
-        building_positions = []
+        # Keep track of building positions to prevent overlapping, bucketed in a coarse grid.
+        # Overlapping buildings are less than one cell apart on both axes, so only the 3x3 cells
+        # around a candidate need checking.
+        grid_size = max(len(template) for template in ALL_BUILDINGS)
+        building_grid = {}
 
         # Try to place each building
         for _ in range(num_buildings):
@@ -91,77 +119,77 @@ class MapGenerator:
                 y = random.randint(EDGE_THICKNESS + 2, MAP_HEIGHT - EDGE_THICKNESS - template_size - 2)
 
                 # Check if this position overlaps with any existing building
-                overlaps = False
-                for bx, by, bs in building_positions:
-                    # Check if buildings would overlap (with a small buffer)
-                    if (abs(x - bx) < (template_size + bs) // 2 and 
-                        abs(y - by) < (template_size + bs) // 2):
-                        overlaps = True
-                        break
+                overlaps = self._building_overlaps(building_grid, grid_size, x, y, template_size)
 
                 # If no overlap, we can place the building here
                 if not overlaps:
-                    building_positions.append((x, y, template_size))
+                    building_grid.setdefault((x // grid_size, y // grid_size), []).append((x, y, template_size))
                     break
 
             # If we couldn't find a valid position after max_attempts, skip this building
             if overlaps:
                 continue
 
-            # Apply the template to the map
+            # Apply the template to the map one row slice at a time
             for ty in range(template_size):
-                for tx in range(template_size):
-                    template_value = building_template[ty][tx]
+                row = self.map_data[y + ty]
+                row[x:x + template_size] = [
                     # Only change if template specifies a tile (not 0)
-                    if template_value == 1:
-                        self.map_data[y + ty][x + tx] = TILE_WALL
-                    elif template_value == 2:
-                        self.map_data[y + ty][x + tx] = TILE_WOOD
+                    _TEMPLATE_TILES.get(template_value, tile)
+                    for template_value, tile in zip(building_template[ty][:template_size], row[x:x + template_size])
+                ]
+
+    @staticmethod
+    def _building_overlaps(building_grid, grid_size, x, y, template_size):
+        """Check a building position against placed buildings in the surrounding grid cells
+
+        Args:
+            building_grid (dict): Cell (x, y) -> list of placed (x, y, size) buildings
+            grid_size (int): Cell size in tiles, at least the largest template size
+            x, y (int): Candidate top-left tile position
+            template_size (int): Candidate template size
+
+        Returns:
+            bool: True if the candidate overlaps a placed building
+        """
+        cell_x = x // grid_size
+        cell_y = y // grid_size
+        for ny in range(cell_y - 1, cell_y + 2):
+            for nx in range(cell_x - 1, cell_x + 2):
+                for bx, by, bs in building_grid.get((nx, ny), ()):
+                    # Check if buildings would overlap (with a small buffer)
+                    if (abs(x - bx) < (template_size + bs) // 2 and
+                            abs(y - by) < (template_size + bs) // 2):
+                        return True
+        return False
 
     def _add_random_objects(self):
         """Add random objects throughout the map"""
+        rand = random.random  # Called once per interior tile
+
         # Add objects randomly throughout the map (excluding edges and buildings)
         for y in range(EDGE_THICKNESS, MAP_HEIGHT - EDGE_THICKNESS):
+            row = self.map_data[y]
             for x in range(EDGE_THICKNESS, MAP_WIDTH - EDGE_THICKNESS):
                 # Skip if the tile is already a wall or wood (part of a building)
-                if self.map_data[y][x] == TILE_WALL or self.map_data[y][x] == TILE_WOOD:
+                tile = row[x]
+                if tile == TILE_WALL or tile == TILE_WOOD:
                     continue
 
                 # Use RANDOM_OBJECT_DENSITY to determine chance to place an object
-                if random.random() < RANDOM_OBJECT_DENSITY:
-                    self.map_data[y][x] = TILE_OBJECT
+                if rand() < RANDOM_OBJECT_DENSITY:
+                    row[x] = TILE_OBJECT
 
-    def _get_sprite_for_tile(self, tile_type):
-        """Get the appropriate sprite for a tile type with fallback
+    def _load_tile_sprite(self, sprite_name, tile_type):
+        """Load a tile sprite with fallback to old names and then to a colored rectangle
 
-        According to the requirements:
-        - Grass tiles should be randomly selected from the first four in the row
-        - Objects should use dirt textures
-        - Walls should use gray tiles
-        - Wood should use wood textures
-        """
-        # Use a random grass texture for grass tiles
-        if tile_type == TILE_GRASS:
-            # Randomly select one of the first four tiles in the first row (grass types)
-            col = random.randint(0, 3)
-            sprite_name = f"tile_grass_0_{col}"
-        # Use dirt textures for objects
-        elif tile_type == TILE_OBJECT:
-            # Randomly select one of the two dirt tiles
-            sprite_name = f"tile_tree"
-        # Use gray tiles for walls
-        elif tile_type == TILE_WALL:
-            # Randomly select one of the five gray tiles
-            col = random.randint(6, 10)
-            sprite_name = f"tile_gray_0_{col}"
-        # Use wood textures for wood
-        elif tile_type == TILE_WOOD:
-            # Use a specific wood texture
-            sprite_name = "tile_building_floor"
-        else:
-            # Default to grass
-            sprite_name = "tile_grass_0_0"
+        Args:
+            sprite_name (str): Preferred sprite name
+            tile_type (int): Tile type, used to pick the fallback
 
+        Returns:
+            pygame.Surface: Tile sprite
+        """
         sprite = get_sprite(sprite_name)
 
         # If sprite not found, try fallback to old names
@@ -182,6 +210,29 @@ class MapGenerator:
 
         return sprite
 
+    def _load_tile_variants(self):
+        """Load every sprite variant per tile type once, before the map surface is drawn
+
+        According to the requirements:
+        - Grass tiles should be randomly selected from the first four in the row
+        - Objects should use the tree texture
+        - Walls should use one of the five gray tiles
+        - Wood should use the building floor texture
+
+        Returns:
+            dict: Tile type -> list of sprites to pick from
+        """
+        variant_names = {
+            TILE_GRASS: [f"tile_grass_0_{col}" for col in range(4)],
+            TILE_OBJECT: ["tile_tree"],
+            TILE_WALL: [f"tile_gray_0_{col}" for col in range(6, 11)],
+            TILE_WOOD: ["tile_building_floor"],
+        }
+        return {
+            tile_type: [self._load_tile_sprite(name, tile_type) for name in names]
+            for tile_type, names in variant_names.items()
+        }
+
     def _create_map_surface(self):
         """Create a surface with the map rendered using sprites"""
         # Create a surface large enough for the entire map
@@ -189,48 +240,31 @@ class MapGenerator:
         surface_height = MAP_HEIGHT * TILE_SIZE
         surface = pygame.Surface((surface_width, surface_height))
 
-        # First pass: Draw all grass tiles
-        for y in range(MAP_HEIGHT):
-            for x in range(MAP_WIDTH):
-                # Always draw grass as the base layer
-                grass_sprite = self._get_sprite_for_tile(TILE_GRASS)
-                pos_x = x * TILE_SIZE
-                pos_y = y * TILE_SIZE
-                surface.blit(grass_sprite, (pos_x, pos_y))
-
-        # Second pass: Draw walls, wood, and overlay objects on top of grass
-        for y in range(MAP_HEIGHT):
-            for x in range(MAP_WIDTH):
-                tile_type = self.map_data[y][x]
-
-                # Skip grass tiles as they're already drawn
-                if tile_type == TILE_GRASS:
-                    continue
-
-                # Calculate position
-                pos_x = x * TILE_SIZE
-                pos_y = y * TILE_SIZE
-
-                if tile_type == TILE_OBJECT:
-                    # For objects, get the tree sprite which should have transparency
-                    sprite_name = "tile_tree"
-                    sprite = get_sprite(sprite_name)
-
-                    # If sprite not found, try fallback
-                    if sprite is None:
-                        sprite = get_sprite("tile_tree")
-
-                    # If still not found, create a colored rectangle
-                    if sprite is None:
-                        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                        sprite.fill(TILE_COLORS[TILE_OBJECT])
-
-                    # Draw the object sprite on top of the grass
-                    surface.blit(sprite, (pos_x, pos_y))
-                else:
-                    # For walls and wood, use the normal sprites
-                    sprite = self._get_sprite_for_tile(tile_type)
-                    surface.blit(sprite, (pos_x, pos_y))
+        tile_variants = self._load_tile_variants()
+
+        # First pass: Draw all grass tiles as the base layer, variants drawn in one batch
+        positions = [(x * TILE_SIZE, y * TILE_SIZE) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH)]
+        grass_picks = random.choices(tile_variants[TILE_GRASS], k=len(positions))
+        surface.blits(list(zip(grass_picks, positions)), False)
+
+        # Second pass: Draw walls, wood, and overlay objects (trees with transparency) on top of grass
+        overlay_tiles = [
+            (tile_type, (x * TILE_SIZE, y * TILE_SIZE))
+            for y, row in enumerate(self.map_data)
+            for x, tile_type in enumerate(row)
+            if tile_type != TILE_GRASS
+        ]
+        # One batched draw of variants per tile type instead of a random call per tile
+        tile_counts = Counter(tile_type for tile_type, _ in overlay_tiles)
+        variant_picks = {
+            tile_type: iter(random.choices(tile_variants[tile_type], k=count))
+            for tile_type, count in tile_counts.items()
+        }
+        surface.blits([(next(variant_picks[tile_type]), pos) for tile_type, pos in overlay_tiles], False)
+
+        # Match the display pixel format so the per-frame viewport blit needs no conversion
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
 
         return surface
 
@@ -249,20 +283,21 @@ class MapGenerator:
 
     def is_walkable(self, x, y):
         """Check if the specified world coordinates are walkable"""
-        tile_type = self.get_tile_at(x, y)
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+
+        if 0 <= tile_x < MAP_WIDTH and 0 <= tile_y < MAP_HEIGHT:
+            return self.walkable_grid[tile_y][tile_x]
 
-        # Grass, objects, and wood (floor inside buildings) are walkable
-        return tile_type == TILE_GRASS or tile_type == TILE_OBJECT or tile_type == TILE_WOOD
+        # Out-of-bounds coordinates count as forest (object), which is walkable
+        return True
 
     def render(self, screen, camera_offset):
         """Render the map to the screen with the specified camera offset"""
-        # Calculate the visible portion of the map based on camera offset
-        view_rect = pygame.Rect(
-            camera_offset[0], 
-            camera_offset[1], 
-            screen.get_width(), 
-            screen.get_height()
-        )
+        # Move the reused view rect to the visible portion of the map based on camera offset
+        view_rect = self._view_rect
+        view_rect.x, view_rect.y = camera_offset
+        view_rect.size = screen.get_size()
 
         # Blit the visible portion of the map to the screen
         # The destination position is (0, 0) because we're blitting the already-offset portion
@@ -1,5 +1,10 @@
-import pygame
+import os
 import sys
+
+# Let SDL do alpha blending, its blitters are SIMD accelerated; must be set before pygame is imported
+os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+
+import pygame
 from game.settings import Settings
 from game.game_state import GameStateManager
 from utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, FPS
@@ -39,7 +44,8 @@ def main():
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
-        fps = clock.get_fps()
+        # Only measured when the active state actually draws it
+        fps = clock.get_fps() if game_state_manager.shows_fps else 0.0
 
         # Event handling
         for event in pygame.event.get():
@@ -54,7 +60,8 @@ def main():
         music_manager.update(dt)
 
         # Render
-        screen.fill((0, 0, 0))
+        if game_state_manager.needs_clear:
+            screen.fill((0, 0, 0))
         game_state_manager.render(screen, fps)
         pygame.display.flip()
 
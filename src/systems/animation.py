@@ -6,222 +6,300 @@ Centralized system for handling all visual effects like explosions,
 muzzle flashes, bullet impacts, etc.
 """
 
+import functools
 import pygame
 import random
 import math
 from utils.constants import WHITE, YELLOW, RED, BLACK
 
+# Effect sprites are cached per alpha step instead of being redrawn every frame
+ALPHA_STEP = 32
+
+
+def _quantize_alpha(alpha):
+    """Round an alpha value to the nearest cached step, 0 means the sprite is invisible and can be skipped"""
+    return min(255, (alpha + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP)
+
+
+def _to_display_format(surface):
+    """Convert a cached sprite to the display pixel format so blits skip per-pixel conversion"""
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+def _draw_circle(radius, color):
+    """Draw a filled circle on a new surface in the display format"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    return _to_display_format(surface)
+
+
+@functools.lru_cache(maxsize=512)
+def _circle_sprite(radius, color):
+    """Get a cached filled circle sprite.
+
+    Args:
+        radius (int): Circle radius in pixels
+        color (tuple): RGBA color, alpha should be quantized with _quantize_alpha
+
+    Returns:
+        pygame.Surface: Shared surface of size (radius * 2, radius * 2), do not modify
+    """
+    return _draw_circle(radius, color)
+
+
+@functools.lru_cache(maxsize=512)
+def _glow_sprite(radius, color):
+    """Get a cached filled circle sprite with premultiplied alpha, blit it with BLEND_PREMULTIPLIED.
+
+    Args:
+        radius (int): Circle radius in pixels
+        color (tuple): RGBA color, alpha should be quantized with _quantize_alpha
+
+    Returns:
+        pygame.Surface: Shared surface of size (radius * 2, radius * 2), do not modify
+    """
+    return _draw_circle(radius, color).premul_alpha()
+
+
+@functools.lru_cache(maxsize=128)
+def _cross_sprite(length, color):
+    """Get a cached spark cross sprite.
+
+    Args:
+        length (int): Length of each spark arm in pixels
+        color (tuple): RGBA color, alpha should be quantized with _quantize_alpha
+
+    Returns:
+        pygame.Surface: Shared surface of size (length * 4, length * 4), do not modify
+    """
+    surface = pygame.Surface((length * 4, length * 4), pygame.SRCALPHA)
+    center = length * 2
+    pygame.draw.line(surface, color, (center - length, center), (center + length, center), 2)
+    pygame.draw.line(surface, color, (center, center - length), (center, center + length), 2)
+    return _to_display_format(surface)
+
 
 class Effect:
     """Base class for all visual effects"""
 
+    __slots__ = ('x', 'y', 'duration', 'start_time', 'kwargs', 'reach', 'progress', '_inv_duration')
+
     def __init__(self, x, y, duration, **kwargs):
         self.x = x
         self.y = y
         self.duration = duration
         self.start_time = pygame.time.get_ticks() / 1000.0
         self.kwargs = kwargs
+        self.reach = 32  # How far from (x, y) the effect can draw, used for viewport culling
+        self.progress = 0.0  # Animation progress (0.0 to 1.0), advanced by AnimationSystem
+        self._inv_duration = 1.0 / duration
 
-    @property
-    def progress(self):
-        """Get animation progress (0.0 to 1.0)"""
-        current_time = pygame.time.get_ticks() / 1000.0
-        elapsed = current_time - self.start_time
-        return min(1.0, elapsed / self.duration)
+    def advance(self, now):
+        """Update animation progress to the given time
+
+        Args:
+            now (float): Current time in seconds, shared by all effects in a frame
+        """
+        self.progress = min(1.0, (now - self.start_time) * self._inv_duration)
 
     @property
     def is_finished(self):
         """Check if effect is finished"""
         return self.progress >= 1.0
 
-    def render(self, screen, camera_offset=(0, 0)):
-        """Render the effect - to be implemented by subclasses"""
+    def collect_blits(self, blits, camera_offset=(0, 0)):
+        """Append the effect's (surface, position) pairs to blits - to be implemented by subclasses
+
+        Args:
+            blits (list): Blit sequence shared by all effects drawn this frame
+            camera_offset (tuple): Camera (x, y) offset
+        """
         pass
 
+    def render(self, screen, camera_offset=(0, 0)):
+        """Render the effect on its own"""
+        self.advance(pygame.time.get_ticks() / 1000.0)
+        blits = []
+        self.collect_blits(blits, camera_offset)
+        screen.blits(blits, False)
+
 
 class MuzzleFlashEffect(Effect):
     """Muzzle flash animation effect"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, duration=0.1, **kwargs):
         super().__init__(x, y, duration, **kwargs)
 
-    def render(self, screen, camera_offset=(0, 0)):
-        if self.is_finished:
+    def collect_blits(self, blits, camera_offset=(0, 0)):
+        progress = self.progress
+        if progress >= 1.0:
             return
 
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
 
         # Flash gets smaller over time
-        size_multiplier = 1.0 - self.progress
+        size_multiplier = 1.0 - progress
         base_radius = 12
         radius = int(base_radius * size_multiplier)
 
-        if radius > 0:
+        alpha = _quantize_alpha(int(255 * (1.0 - progress)))
+
+        if radius > 0 and alpha:
             # Outer yellow flash
-            flash_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            alpha = int(255 * (1.0 - self.progress))
-            pygame.draw.circle(flash_surface, (255, 255, 0, alpha), (radius, radius), radius)
-            screen.blit(flash_surface, (screen_x - radius, screen_y - radius))
+            blits.append((_circle_sprite(radius, (255, 255, 0, alpha)), (screen_x - radius, screen_y - radius)))
 
             # Inner white core
             inner_radius = max(1, radius // 2)
-            core_surface = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(core_surface, (255, 255, 255, alpha), (inner_radius, inner_radius), inner_radius)
-            screen.blit(core_surface, (screen_x - inner_radius, screen_y - inner_radius))
+            blits.append((_circle_sprite(inner_radius, (255, 255, 255, alpha)),
+                          (screen_x - inner_radius, screen_y - inner_radius)))
 
 
 class BulletImpactEffect(Effect):
     """Bullet impact sparks effect"""
 
+    __slots__ = ('color',)
+
     def __init__(self, x, y, duration=0.2, **kwargs):
         super().__init__(x, y, duration, **kwargs)
         self.color = kwargs.get('color', (255, 255, 255))
 
-    def render(self, screen, camera_offset=(0, 0)):
-        if self.is_finished:
+    def collect_blits(self, blits, camera_offset=(0, 0)):
+        progress = self.progress
+        if progress >= 1.0:
             return
 
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
 
-        alpha = int(255 * (1.0 - self.progress))
+        alpha = _quantize_alpha(int(255 * (1.0 - progress)))
         color_with_alpha = (*self.color, alpha)
 
-        # Draw sparks as small lines
-        spark_length = int(6 * (1.0 - self.progress))
-        if spark_length > 0:
-            # Create surface for alpha blending
-            spark_surface = pygame.Surface((spark_length * 4, spark_length * 4), pygame.SRCALPHA)
-
-            # Draw cross pattern
+        # Draw sparks as a small cross
+        spark_length = int(6 * (1.0 - progress))
+        if spark_length > 0 and alpha:
             center = spark_length * 2
-            pygame.draw.line(spark_surface, color_with_alpha,
-                             (center - spark_length, center), (center + spark_length, center), 2)
-            pygame.draw.line(spark_surface, color_with_alpha,
-                             (center, center - spark_length), (center, center + spark_length), 2)
-
-            screen.blit(spark_surface, (screen_x - center, screen_y - center))
+            blits.append((_cross_sprite(spark_length, color_with_alpha), (screen_x - center, screen_y - center)))
 
 
 class BloodSplatterEffect(Effect):
     """Blood splatter effect with multiple particles"""
 
+    __slots__ = ('particles',)
+
     def __init__(self, x, y, duration=0.8, **kwargs):
         super().__init__(x, y, duration, **kwargs)
 
-        # Create blood particles
+        # Create blood particles as (offset_x, offset_y, size, color, lifetime_multiplier) tuples
         self.particles = []
         num_particles = random.randint(4, 8)
 
         for _ in range(num_particles):
-            self.particles.append({
-                'offset_x': random.randint(-12, 12),
-                'offset_y': random.randint(-12, 12),
-                'size': random.randint(2, 6),
-                'color': (random.randint(120, 180), 0, 0),
-                'lifetime_multiplier': random.uniform(0.7, 1.3)
-            })
-
-    def render(self, screen, camera_offset=(0, 0)):
-        if self.is_finished:
+            self.particles.append((
+                random.randint(-12, 12),
+                random.randint(-12, 12),
+                random.randint(2, 6),
+                (random.randint(120, 180), 0, 0),
+                random.uniform(0.7, 1.3)
+            ))
+
+    def collect_blits(self, blits, camera_offset=(0, 0)):
+        progress = self.progress
+        if progress >= 1.0:
             return
 
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
 
-        for particle in self.particles:
+        for offset_x, offset_y, particle_size, color, lifetime_multiplier in self.particles:
             # Calculate particle-specific progress
-            particle_progress = min(1.0, self.progress * particle['lifetime_multiplier'])
+            particle_progress = progress * lifetime_multiplier
 
             if particle_progress < 1.0:
-                part_x = screen_x + particle['offset_x']
-                part_y = screen_y + particle['offset_y']
+                alpha = _quantize_alpha(int(255 * (1.0 - particle_progress)))
+                size = int(particle_size * (1.0 + particle_progress * 0.5))  # Grow slightly
 
-                alpha = int(255 * (1.0 - particle_progress))
-                size = int(particle['size'] * (1.0 + particle_progress * 0.5))  # Grow slightly
-
-                if alpha > 0 and size > 0:
-                    blood_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    color_with_alpha = (*particle['color'], alpha)
-                    pygame.draw.circle(blood_surface, color_with_alpha, (size, size), size)
-                    screen.blit(blood_surface, (part_x - size, part_y - size))
+                if alpha and size > 0:
+                    blits.append((_circle_sprite(size, (*color, alpha)),
+                                  (screen_x + offset_x - size, screen_y + offset_y - size)))
 
 
 class ExplosionEffect(Effect):
     """Explosion effect with particles"""
 
+    __slots__ = ('max_radius', 'particles')
+
     def __init__(self, x, y, duration=0.6, **kwargs):
         super().__init__(x, y, duration, **kwargs)
         self.max_radius = kwargs.get('radius', 50)
+        # Particles fly up to 80 px/s and fall with gravity, so they can outreach the blast
+        self.reach = max(self.max_radius, 80 * duration + 50 * duration ** 2) + 8
 
-        # Create explosion particles
+        # Create explosion particles as (vx, vy, size, color) tuples, all starting at the blast center
         self.particles = []
         num_particles = random.randint(8, 15)
 
         for _ in range(num_particles):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(30, 80)
-            self.particles.append({
-                'start_x': x,
-                'start_y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': random.randint(3, 8),
-                'color': random.choice([
+            self.particles.append((
+                math.cos(angle) * speed,
+                math.sin(angle) * speed,
+                random.randint(3, 8),
+                random.choice([
                     (255, 255, 100),  # Bright yellow
                     (255, 200, 0),  # Orange
                     (255, 100, 0),  # Dark orange
                     (200, 50, 0)  # Red
                 ])
-            })
+            ))
 
-    def render(self, screen, camera_offset=(0, 0)):
-        if self.is_finished:
+    def collect_blits(self, blits, camera_offset=(0, 0)):
+        progress = self.progress
+        if progress >= 1.0:
             return
 
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
 
         # Main explosion circle
-        current_radius = int(self.max_radius * self.progress)
-        alpha = max(0, int(255 * (1.0 - self.progress)))
+        current_radius = int(self.max_radius * progress)
+        alpha = max(0, int(255 * (1.0 - progress)))
 
-        if current_radius > 0 and alpha > 0:
-            # Outer blast wave
-            blast_surface = pygame.Surface((current_radius * 2, current_radius * 2), pygame.SRCALPHA)
-            blast_color = (255, 150, 0, alpha // 2)
-            pygame.draw.circle(blast_surface, blast_color, (current_radius, current_radius), current_radius)
-            screen.blit(blast_surface, (screen_x - current_radius, screen_y - current_radius))
+        # Glow sprites carry premultiplied alpha, so they go through the premultiplied blitter
+        premultiplied = pygame.BLEND_PREMULTIPLIED
 
-            # Inner core
-            inner_radius = max(1, current_radius // 2)
-            core_surface = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
-            core_color = (255, 255, 200, alpha)
-            pygame.draw.circle(core_surface, core_color, (inner_radius, inner_radius), inner_radius)
-            screen.blit(core_surface, (screen_x - inner_radius, screen_y - inner_radius))
-
-        # Render flying particles
-        for particle in self.particles:
-            # Calculate particle position
-            time_factor = self.progress
-            part_x = particle['start_x'] + particle['vx'] * time_factor * self.duration
-            part_y = particle['start_y'] + particle['vy'] * time_factor * self.duration
+        blast_alpha = _quantize_alpha(alpha // 2)
+        part_alpha = _quantize_alpha(alpha)
 
-            # Add gravity to particles
-            part_y += 0.5 * 100 * (time_factor * self.duration) ** 2
+        if current_radius > 0 and part_alpha:
+            # Outer blast wave, fades out before the core
+            if blast_alpha:
+                blits.append((_glow_sprite(current_radius, (255, 150, 0, blast_alpha)),
+                              (screen_x - current_radius, screen_y - current_radius), None, premultiplied))
 
-            part_screen_x = int(part_x - camera_offset[0])
-            part_screen_y = int(part_y - camera_offset[1])
+            # Inner core
+            inner_radius = max(1, current_radius // 2)
+            core_color = (255, 255, 200, part_alpha)
+            blits.append((_glow_sprite(inner_radius, core_color),
+                          (screen_x - inner_radius, screen_y - inner_radius), None, premultiplied))
 
-            part_alpha = max(0, int(255 * (1.0 - self.progress)))
-            part_size = max(1, int(particle['size'] * (1.0 - self.progress * 0.5)))
+        # Render flying particles, everything but velocity and size is shared by the whole burst
+        if part_alpha:
+            elapsed = progress * self.duration
+            origin_x = self.x - camera_offset[0]
+            origin_y = self.y - camera_offset[1] + 0.5 * 100 * elapsed * elapsed  # Gravity
+            size_scale = 1.0 - progress * 0.5
 
-            if part_alpha > 0 and part_size > 0:
-                particle_surface = pygame.Surface((part_size * 2, part_size * 2), pygame.SRCALPHA)
-                particle_color = (*particle['color'], part_alpha)
-                pygame.draw.circle(particle_surface, particle_color, (part_size, part_size), part_size)
-                screen.blit(particle_surface, (part_screen_x - part_size, part_screen_y - part_size))
+            for vx, vy, size, color in self.particles:
+                part_size = max(1, int(size * size_scale))
+                blits.append((_glow_sprite(part_size, (*color, part_alpha)),
+                              (int(origin_x + vx * elapsed) - part_size, int(origin_y + vy * elapsed) - part_size),
+                              None, premultiplied))
 
 
 class AnimationSystem:
@@ -229,6 +307,7 @@ class AnimationSystem:
 
     def __init__(self):
         self.effects = []
+        self._blits = []  # Blit sequence reused across frames
         self.effect_types = {
             'muzzle_flash': MuzzleFlashEffect,
             'bullet_impact': BulletImpactEffect,
@@ -245,12 +324,38 @@ class AnimationSystem:
 
     def update(self, dt):
         """Update and remove finished effects"""
-        self.effects = [effect for effect in self.effects if not effect.is_finished]
+        # One clock read per frame, shared by every effect
+        now = pygame.time.get_ticks() / 1000.0
+
+        # Compact in place with a write index instead of building a new list
+        effects = self.effects
+        write = 0
+        for effect in effects:
+            effect.advance(now)
+            if effect.progress < 1.0:
+                effects[write] = effect
+                write += 1
+        del effects[write:]
 
     def render(self, screen, camera_offset=(0, 0)):
-        """Render all active effects"""
+        """Render active effects that are inside the visible area"""
+        left = camera_offset[0]
+        top = camera_offset[1]
+        right = left + screen.get_width()
+        bottom = top + screen.get_height()
+        now = pygame.time.get_ticks() / 1000.0
+
+        # Every visible effect adds its sprites to one sequence, drawn with a single blits call
+        blits = self._blits
         for effect in self.effects:
-            effect.render(screen, camera_offset)
+            reach = effect.reach
+            if left - reach < effect.x < right + reach and top - reach < effect.y < bottom + reach:
+                effect.advance(now)
+                effect.collect_blits(blits, camera_offset)
+
+        if blits:
+            screen.blits(blits, False)
+            blits.clear()
 
     def clear(self):
         """Clear all effects"""
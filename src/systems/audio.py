@@ -17,24 +17,28 @@ class SoundManager:
         self.master_volume = 0.7
         self.music_volume = 0.3
         self.sfx_volume = 0.8
+        self._sfx_effective = self.sfx_volume * self.master_volume  # Default sound effect channel volume
 
         # Current music state
         self.current_music = None
         self.music_playing = False
         self.music_paused = False
 
-        # Sound cache - loads all sounds at startup
+        # Sound cache - sounds are loaded on first use
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
 
+        # File path of every sound found at startup, music is streamed from the file instead of a Sound object
+        self.sound_paths: Dict[str, str] = {}
+
         # Sound groups for cycling (e.g., hit_flesh_1, hit_flesh_2, hit_flesh_3)
         self.sound_groups: Dict[str, list] = {}
 
-        # Load all sounds
+        # Find all sounds
         self._load_all_sounds()
         self._organize_sound_groups()
 
     def _load_all_sounds(self):
-        """Load all sounds from assets/sounds directory recursively"""
+        """Find all sounds in assets/sounds directory recursively, they are loaded lazily by _get_sound"""
         sounds_dir = "../assets/sounds"  # Opravená cesta
 
         if not os.path.exists(sounds_dir):
@@ -53,18 +57,44 @@ class SoundManager:
                     # Remove file extension from name
                     sound_name = '_'.join(sound_name.split('_')[:-1])
 
-                    try:
-                        self.sounds[sound_name] = pygame.mixer.Sound(file_path)
-                        print(f"Loaded sound: {sound_name} <- {relative_path}")
-                    except pygame.error as e:
-                        print(f"Failed to load sound {file_path}: {e}")
+                    self.sound_paths[sound_name] = file_path
+
+        print(f"Total sounds found: {len(self.sound_paths)}")
+
+    def _get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Get a sound, loading it from disk on first use
+
+        Args:
+            sound_name (str): Name of the sound (e.g., 'weapons_pistol')
+
+        Returns:
+            pygame.mixer.Sound: The loaded sound, or None if it doesn't exist or failed to load
+        """
+        sound = self.sounds.get(sound_name)
+        if sound is None and sound_name in self.sound_paths:
+            file_path = self.sound_paths[sound_name]
+            try:
+                sound = pygame.mixer.Sound(file_path)
+                self.sounds[sound_name] = sound
+                print(f"Loaded sound: {sound_name} <- {file_path}")
+            except pygame.error as e:
+                print(f"Failed to load sound {file_path}: {e}")
+        return sound
+
+    def prewarm(self, sound_names):
+        """Load sounds ahead of time so their first playback doesn't hit the disk
 
-        print(f"Total sounds loaded: {len(self.sounds)}")
+        Args:
+            sound_names (list): Sound or sound group names
+        """
+        for sound_name in sound_names:
+            for actual_sound_name in self.sound_groups.get(sound_name, (sound_name,)):
+                self._get_sound(actual_sound_name)
 
     def _organize_sound_groups(self):
         """Organize sounds into groups for random/cycling playback"""
         # Group sounds by base name (e.g., hit_flesh_1, hit_flesh_2 -> hit_flesh group)
-        for sound_name in self.sounds.keys():
+        for sound_name in self.sound_paths.keys():
             # Check if sound name ends with a number
             parts = sound_name.split('_')
             if len(parts) >= 2 and parts[-1].isdigit():
@@ -99,22 +129,22 @@ class SoundManager:
         else:
             actual_sound_name = sound_name
 
-        if actual_sound_name not in self.sounds:
+        sound = self._get_sound(actual_sound_name)
+        if sound is None:
             print(f"Sound not found: {sound_name} (tried: {actual_sound_name})")
-            print(f"Available sounds: {list(self.sounds.keys())}")
+            print(f"Available sounds: {list(self.sound_paths.keys())}")
             print(f"Available groups: {list(self.sound_groups.keys())}")
             return False
 
         try:
-            sound = self.sounds[actual_sound_name]
-
             # Set volume
-            if volume is not None:
-                sound.set_volume(volume * self.master_volume)
-            else:
-                sound.set_volume(self.sfx_volume * self.master_volume)
+            # Volume goes on the channel, the shared Sound keeps its own volume for overlapping plays
+            channel = pygame.mixer.find_channel(True)
+            if channel is None:
+                return False
 
-            sound.play()
+            channel.play(sound)
+            channel.set_volume(volume * self.master_volume if volume is not None else self._sfx_effective)
             return True
 
         except pygame.error as e:
@@ -148,41 +178,28 @@ class SoundManager:
         if self.music_playing:
             self.stop_music()
 
-        if music_name not in self.sounds:
+        # For music, we need to load the actual file path, not the Sound object
+        file_path = self.sound_paths.get(music_name)
+        if file_path is None:
             print(f"Music not found: {music_name}")
             return False
 
         try:
-            # For music, we need to load the actual file path, not the Sound object
-            # Find the original file path
-            sounds_dir = "../assets/sounds"  # Opravená cesta
-            for root, dirs, files in os.walk(sounds_dir):
-                for filename in files:
-                    if filename.lower().endswith(('.wav', '.mp3', '.ogg')):
-                        file_path = os.path.join(root, filename)
-                        relative_path = os.path.relpath(file_path, sounds_dir)
-                        sound_name_check = relative_path.replace(os.sep, '_').replace('.', '_')
-                        sound_name_check = '_'.join(sound_name_check.split('_')[:-1])
-
-                        if sound_name_check == music_name:
-                            # Load and play with pygame.mixer.music
-                            pygame.mixer.music.load(file_path)
-                            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-
-                            if fade_in > 0:
-                                pygame.mixer.music.play(-1 if loop else 0, fade_ms=int(fade_in * 1000))
-                            else:
-                                pygame.mixer.music.play(-1 if loop else 0)
-
-                            self.current_music = music_name
-                            self.music_playing = True
-                            self.music_paused = False
-
-                            print(f"Playing music: {music_name}")
-                            return True
-
-            print(f"Music file not found for: {music_name}")
-            return False
+            # Load and play with pygame.mixer.music
+            pygame.mixer.music.load(file_path)
+            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
+
+            if fade_in > 0:
+                pygame.mixer.music.play(-1 if loop else 0, fade_ms=int(fade_in * 1000))
+            else:
+                pygame.mixer.music.play(-1 if loop else 0)
+
+            self.current_music = music_name
+            self.music_playing = True
+            self.music_paused = False
+
+            print(f"Playing music: {music_name}")
+            return True
 
         except pygame.error as e:
             print(f"Failed to play music {music_name}: {e}")
@@ -229,6 +246,7 @@ class SoundManager:
     def set_master_volume(self, volume: float):
         """Set master volume for all audio"""
         self.master_volume = max(0.0, min(1.0, volume))
+        self._sfx_effective = self.sfx_volume * self.master_volume
 
         # Update music volume if playing
         if self.music_playing:
@@ -254,11 +272,12 @@ class SoundManager:
     def set_sfx_volume(self, volume: float):
         """Set sound effects volume"""
         self.sfx_volume = max(0.0, min(1.0, volume))
+        self._sfx_effective = self.sfx_volume * self.master_volume
         print(f"SFX volume set to: {self.sfx_volume:.1f}")
 
     def get_available_sounds(self) -> list:
         """Get list of all available sounds"""
-        return list(self.sounds.keys())
+        return list(self.sound_paths.keys())
 
     def get_available_groups(self) -> list:
         """Get list of all available sound groups"""
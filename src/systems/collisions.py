@@ -8,10 +8,7 @@ different entity types and provides a unified interface for collision checks.
 """
 
 import math
-from utils.constants import (
-    TILE_GRASS, TILE_OBJECT, TILE_WOOD,
-    ZOMBIE_COLLISION_RADIUS
-)
+from utils.constants import ZOMBIE_COLLISION_RADIUS
 
 class CollisionSystem:
     """
@@ -36,10 +33,9 @@ class CollisionSystem:
         Returns:
             bool: True if entities are colliding, False otherwise
         """
-        # Calculate distance between entity centers
+        # Calculate squared distance between entity centers
         dx = entity1.x + entity1.width/2 - (entity2.x + entity2.width/2)
         dy = entity1.y + entity1.height/2 - (entity2.y + entity2.height/2)
-        distance = (dx * dx + dy * dy) ** 0.5
 
         # Increase pickup radius for items and weapons
         pickup_radius_multiplier = 1.0
@@ -49,7 +45,14 @@ class CollisionSystem:
             pickup_radius_multiplier = 2.0  # Double the pickup radius for items
 
         # Check if distance is less than sum of radii (using width as diameter)
-        return distance < (entity1.width + entity2.width) / 2 * pickup_radius_multiplier
+        radius = (entity1.width + entity2.width) / 2 * pickup_radius_multiplier
+
+        # Broad phase: centers further apart than the radius on either axis can't be inside the circle
+        if abs(dx) >= radius or abs(dy) >= radius:
+            return False
+
+        # Narrow phase, compared squared so no square root is needed
+        return dx * dx + dy * dy < radius * radius
 
     def check_entity_list_collision(self, entity, entity_list):
         """Check if an entity is colliding with any entity in a list.
@@ -81,10 +84,9 @@ class CollisionSystem:
         if not self.map_generator:
             return True  # If no map generator, assume all positions are walkable
 
-        tile_type = self.map_generator.get_tile_at(x, y)
-
-        # Entities can walk on floor (TILE_GRASS), objects (TILE_OBJECT), and wood (TILE_WOOD) but not on walls
-        return tile_type == TILE_GRASS or tile_type == TILE_OBJECT or tile_type == TILE_WOOD
+        # Entities can walk on floor (TILE_GRASS), objects (TILE_OBJECT), and wood (TILE_WOOD) but not on walls,
+        # the map generator keeps a precomputed walkability grid for this
+        return self.map_generator.is_walkable(x, y)
 
     def check_wall_collision(self, entity, new_x, new_y):
         """Check if an entity would collide with a wall at the specified position.
@@ -186,25 +188,32 @@ class CollisionSystem:
 
         Args:
             zombie: The zombie to check
-            zombies: List of all zombies
+            zombies: Zombies to separate from, e.g. the nearby ones from a SpatialHash query
 
         Returns:
             tuple: (new_x, new_y) - New position after resolving collisions
         """
         new_x, new_y = zombie.x, zombie.y
 
+        # The zombie's own center and the radius don't change inside the loop
+        center_x = zombie.x + zombie.width / 2
+        center_y = zombie.y + zombie.height / 2
+        min_distance = ZOMBIE_COLLISION_RADIUS
+        min_distance_sq = min_distance * min_distance
+        sqrt = math.sqrt
+
         for other_zombie in zombies:
-            if zombie == other_zombie:
+            if zombie is other_zombie:
                 continue  # Skip self
 
             # Calculate distance between zombie centers
-            dx = (zombie.x + zombie.width/2) - (other_zombie.x + other_zombie.width/2)
-            dy = (zombie.y + zombie.height/2) - (other_zombie.y + other_zombie.height/2)
-            distance = math.sqrt(dx * dx + dy * dy)
+            dx = center_x - (other_zombie.x + other_zombie.width / 2)
+            dy = center_y - (other_zombie.y + other_zombie.height / 2)
+            distance_sq = dx * dx + dy * dy
 
             # If zombies are too close, push them apart - but GENTLY
-            min_distance = ZOMBIE_COLLISION_RADIUS
-            if min_distance > distance > 0:  # Avoid division by zero
+            if min_distance_sq > distance_sq > 0:  # Avoid division by zero
+                distance = sqrt(distance_sq)  # Only needed for overlapping pairs
                 # Calculate push direction and force - MUCH SMALLER FORCE
                 push_x = dx / distance
                 push_y = dy / distance
@@ -217,6 +226,92 @@ class CollisionSystem:
         return new_x, new_y
 
 
+class SpatialHash:
+    """
+    Uniform grid broadphase for finding entities near an area without scanning all of them.
+    Entities are bucketed into every cell their bounding box overlaps.
+    """
+
+    def __init__(self, cell_size=128):
+        """Initialize the spatial hash.
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Remove all entities from the grid."""
+        self.cells.clear()
+
+    def insert(self, entity):
+        """Insert an entity into every cell its bounding box overlaps.
+
+        Args:
+            entity: Entity with x, y, width and height attributes
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        x0 = int(entity.x // cell_size)
+        y0 = int(entity.y // cell_size)
+        x1 = int((entity.x + entity.width) // cell_size)
+        y1 = int((entity.y + entity.height) // cell_size)
+
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entity]
+                else:
+                    bucket.append(entity)
+
+    def rebuild(self, entities):
+        """Clear the grid and insert all given entities.
+
+        Args:
+            entities: Iterable of entities to insert
+        """
+        self.cells.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def query(self, x, y, width, height):
+        """Get entities stored in the cells overlapping a rectangle.
+
+        This is a broadphase query - callers still need a narrow collision test.
+
+        Args:
+            x (float): Left edge of the area in world space
+            y (float): Top edge of the area in world space
+            width (float): Width of the area
+            height (float): Height of the area
+
+        Returns:
+            list: Candidate entities, each listed once (do not modify)
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        x0 = int(x // cell_size)
+        y0 = int(y // cell_size)
+        x1 = int((x + width) // cell_size)
+        y1 = int((y + height) // cell_size)
+
+        # Common case: the area fits in a single cell, no deduplication needed
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), [])
+
+        found = []
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for entity in cells.get((cx, cy), ()):
+                    if entity not in seen:
+                        seen.add(entity)
+                        found.append(entity)
+        return found
+
+
 # Create a global instance for convenience
 collision_system = None
 
@@ -1,13 +1,13 @@
 import random
 import math
-from entities.zombies import Zombie
+from entities.zombies import Zombie, FastZombie, ToughZombie
 from systems import collisions
 from utils.constants import (
     TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT,
     INITIAL_MAX_ZOMBIES, MAX_ZOMBIES_CAP, ZOMBIE_SPAWN_RATE_INITIAL,
     ZOMBIE_SPAWN_RATE_MIN, ZOMBIE_SPAWN_RATE_DECREASE_INTERVAL, ZOMBIE_SPAWN_RATE_DECREASE_AMOUNT,
     ZOMBIE_MAX_INCREASE_RATE, INITIAL_ZOMBIE_COUNT,
-    ZOMBIE_SPAWN_DISTANCE_MIN, ZOMBIE_SPAWN_DISTANCE_MAX
+    ZOMBIE_SPAWN_DISTANCE_MIN, ZOMBIE_SPAWN_DISTANCE_MAX, ZOMBIE_COLLISION_RADIUS
 )
 
 
@@ -28,6 +28,9 @@ class EnemySpawner:
         self.current_spawn_rate = ZOMBIE_SPAWN_RATE_INITIAL  # Current spawn rate in seconds
         self.time_since_last_decrease = 0  # Time since last spawn rate decrease
 
+        # Broadphase grid for zombie-zombie separation, only nearby zombies push each other
+        self.separation_grid = collisions.SpatialHash(cell_size=64)
+
         # Calculate minimum spawn distance to be outside visible area
         # Use screen diagonal as minimum distance to ensure spawning outside view
         screen_diagonal = math.sqrt(WINDOW_WIDTH ** 2 + WINDOW_HEIGHT ** 2)
@@ -43,18 +46,15 @@ class EnemySpawner:
 
     def _spawn_initial_zombies(self):
         """Spawn initial zombies at game start"""
+        walkable_tiles = self.map_generator.walkable_tiles
         for _ in range(INITIAL_ZOMBIE_COUNT):
-            # Find a random position on the map
-            x = random.randint(0, self.map_width_px)
-            y = random.randint(0, self.map_height_px)
-
-            # Ensure position is within map bounds and walkable
-            x = max(0, min(x, self.map_width_px))
-            y = max(0, min(y, self.map_height_px))
+            # Pick a random walkable tile and a random position inside it
+            tile_x, tile_y = random.choice(walkable_tiles)
+            x = tile_x * TILE_SIZE + random.randrange(TILE_SIZE)
+            y = tile_y * TILE_SIZE + random.randrange(TILE_SIZE)
 
-            if self.map_generator.is_walkable(x, y):
-                zombie = Zombie(x, y)
-                self.zombies.append(zombie)
+            zombie = Zombie(x, y)
+            self.zombies.append(zombie)
 
     def update(self, dt, player_x, player_y):
         """Update spawner state and spawn new zombies if needed
@@ -79,18 +79,39 @@ class EnemySpawner:
                                           self.current_spawn_rate - ZOMBIE_SPAWN_RATE_DECREASE_AMOUNT)
             self.time_since_last_decrease = 0
 
-        for zombie in self.zombies[:]:
-            # Normal movement update
-            zombie.update(dt, player_x, player_y, self.map_generator)
-
-            # Resolve zombie-zombie collisions
-            new_x, new_y = collisions.check_zombie_collisions(zombie, self.zombies)
-            zombie.x = new_x
-            zombie.y = new_y
-
-            # Update zombie's rect position manually (without calling full update)
-            zombie.rect.x = int(zombie.x)
-            zombie.rect.y = int(zombie.y)
+        zombies = self.zombies
+
+        # Normal movement update for every zombie first, then a separate separation sweep,
+        # so each loop runs the same code back to back
+        map_generator = self.map_generator
+        for zombie in zombies:
+            zombie.update(dt, player_x, player_y, map_generator)
+
+        if len(zombies) >= 2:
+            separation_grid = self.separation_grid
+            separation_grid.rebuild(zombies)
+            # Local bindings for the separation sweep
+            query = separation_grid.query
+            separate = collisions.check_zombie_collisions
+            radius = ZOMBIE_COLLISION_RADIUS
+            span = radius * 2
+            for zombie in zombies:
+                # Resolve zombie-zombie collisions against zombies in the surrounding grid cells
+                nearby_zombies = query(zombie.x + zombie.width / 2 - radius,
+                                       zombie.y + zombie.height / 2 - radius,
+                                       span, span)
+                new_x, new_y = separate(zombie, nearby_zombies)
+                zombie.x = new_x
+                zombie.y = new_y
+
+                # Update zombie's rect position manually (without calling full update)
+                zombie.rect.x = int(zombie.x)
+                zombie.rect.y = int(zombie.y)
+        else:
+            # Nothing to separate from, only sync the rect to the moved position
+            for zombie in zombies:
+                zombie.rect.x = int(zombie.x)
+                zombie.rect.y = int(zombie.y)
 
         # Spawn new zombie if timer exceeds spawn rate and we haven't reached max zombies
         if self.spawn_timer >= self.current_spawn_rate and len(self.zombies) < self.max_zombies:
@@ -101,9 +122,17 @@ class EnemySpawner:
         self.max_zombies = self._calculate_max_zombies()
 
     def render(self, screen, camera_offset=(0, 0)):
-        """Render all zombies"""
+        """Render zombies that are inside the visible area"""
+        # Margin covers rotated and scaled attack sprites that extend past the zombie rect
+        margin = 96
+        left = camera_offset[0] - margin
+        top = camera_offset[1] - margin
+        right = camera_offset[0] + screen.get_width() + margin
+        bottom = camera_offset[1] + screen.get_height() + margin
+
         for zombie in self.zombies:
-            zombie.render(screen, camera_offset)
+            if left - zombie.width < zombie.x < right and top - zombie.height < zombie.y < bottom:
+                zombie.render(screen, camera_offset)
 
     def get_zombies(self):
         """Get list of all active zombies"""
@@ -131,52 +160,56 @@ class EnemySpawner:
             player_x (float): Player's x position
             player_y (float): Player's y position
         """
+        zombies = self.zombies
+        uniform = random.uniform
+        cos, sin = math.cos, math.sin
+
         # Try to find a valid spawn position
         for _ in range(20):  # Try up to 20 times (increased from 10)
             # Calculate random angle and distance
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(self.min_spawn_distance, self.max_spawn_distance)
+            angle = uniform(0, 2 * math.pi)
+            distance = uniform(self.min_spawn_distance, self.max_spawn_distance)
 
             # Calculate spawn position
-            spawn_x = int(player_x + math.cos(angle) * distance)
-            spawn_y = int(player_y + math.sin(angle) * distance)
+            spawn_x = int(player_x + cos(angle) * distance)
+            spawn_y = int(player_y + sin(angle) * distance)
 
             # Ensure spawn position is within map bounds
             spawn_x = max(0, min(spawn_x, self.map_width_px))
             spawn_y = max(0, min(spawn_y, self.map_height_px))
 
             # Check if position is walkable
-            if self.map_generator.is_walkable(spawn_x, spawn_y):
-                # Determine zombie type based on weighted probability
-                # 60% normal, 20% fast, 20% tough
-                rand_value = random.random()
-
-                if rand_value < 0.6:  # 60% chance for normal zombie
-                    temp_zombie = Zombie(spawn_x, spawn_y)
-                    zombie_type = "weak"
-                elif rand_value < 0.8:  # 20% chance for fast zombie (0.6 to 0.8)
-                    from entities.zombies import FastZombie
-                    temp_zombie = FastZombie(spawn_x, spawn_y)
-                    zombie_type = "fast"
-                else:  # 20% chance for tough zombie (0.8 to 1.0)
-                    from entities.zombies import ToughZombie
-                    temp_zombie = ToughZombie(spawn_x, spawn_y)
-                    zombie_type = "tough"
-
-                # Check if there's enough space (no collision with other zombies)
-                collision_detected = False
-                for existing_zombie in self.zombies:
-                    dx = temp_zombie.x - existing_zombie.x
-                    dy = temp_zombie.y - existing_zombie.y
-                    distance_to_existing = math.sqrt(dx * dx + dy * dy)
-
-                    # Require minimum distance between zombies at spawn
-                    if distance_to_existing < 40:  # 40 pixels minimum distance
-                        collision_detected = True
-                        break
-
-                # If no collision, spawn the zombie
-                if not collision_detected:
-                    self.zombies.append(temp_zombie)
-                    print(f"Spawned {zombie_type} zombie! (Total: {len(self.zombies)})")
-                    break
\ No newline at end of file
+            if not self.map_generator.is_walkable(spawn_x, spawn_y):
+                continue
+
+            # Check if there's enough space (no collision with other zombies) before building the zombie
+            collision_detected = False
+            for existing_zombie in zombies:
+                dx = spawn_x - existing_zombie.x
+                dy = spawn_y - existing_zombie.y
+
+                # Require minimum distance between zombies at spawn
+                if dx * dx + dy * dy < 40 * 40:  # 40 pixels minimum distance, compared squared
+                    collision_detected = True
+                    break
+
+            if collision_detected:
+                continue
+
+            # Determine zombie type based on weighted probability
+            # 60% normal, 20% fast, 20% tough
+            rand_value = random.random()
+
+            if rand_value < 0.6:  # 60% chance for normal zombie
+                zombie = Zombie(spawn_x, spawn_y)
+                zombie_type = "weak"
+            elif rand_value < 0.8:  # 20% chance for fast zombie (0.6 to 0.8)
+                zombie = FastZombie(spawn_x, spawn_y)
+                zombie_type = "fast"
+            else:  # 20% chance for tough zombie (0.8 to 1.0)
+                zombie = ToughZombie(spawn_x, spawn_y)
+                zombie_type = "tough"
+
+            zombies.append(zombie)
+            print(f"Spawned {zombie_type} zombie! (Total: {len(zombies)})")
+            break
\ No newline at end of file
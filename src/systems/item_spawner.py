@@ -9,6 +9,9 @@ from utils.constants import (
 )
 from systems.items import ItemFactory, create_random_item, create_random_powerup
 
+# Unit vectors at one degree steps, so spawn attempts around the player pick a direction without trig calls
+_SPAWN_DIRECTIONS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(360))
+
 
 class ItemSpawner:
     """Manages spawning of items across the map"""
@@ -28,6 +31,36 @@ class ItemSpawner:
         self.powerup_spawn_interval = 25.0  # Spawn powerup every 25 seconds
         self.ui = None  # UI reference for notifications, set by game state
 
+        # Grass tiles far enough from walls, so map-wide spawns can sample instead of retrying
+        self.spawn_tiles = self._find_spawn_tiles()
+
+    def _find_spawn_tiles(self):
+        """Find grass tiles whose whole wall-check area is grass or objects
+
+        The check area in _is_valid_spawn_position reaches at most two tiles away,
+        so blocked tiles mark their 5x5 neighbourhood as unusable.
+
+        Returns:
+            list: Tile coordinates (x, y) that always pass the wall distance check
+        """
+        map_data = self.map_generator.map_data
+        reach = 64 // TILE_SIZE
+        blocked = set()
+        for y in range(MAP_HEIGHT):
+            row = map_data[y]
+            for x in range(MAP_WIDTH):
+                if row[x] != TILE_GRASS and row[x] != TILE_OBJECT:
+                    for ny in range(y - reach, y + reach + 1):
+                        for nx in range(x - reach, x + reach + 1):
+                            blocked.add((nx, ny))
+
+        return [
+            (x, y)
+            for y in range(MAP_HEIGHT)
+            for x in range(MAP_WIDTH)
+            if map_data[y][x] == TILE_GRASS and (x, y) not in blocked
+        ]
+
     def _is_item_expired(self, item):
         """Check if item is expired, handling both method and attribute cases
 
@@ -72,17 +105,16 @@ class ItemSpawner:
         Args:
             dt (float): Time delta in seconds
         """
-        # Update all items
-        expired_items = []
-        for item in self.items:
+        # Update all items, compacting expired ones out of the list in the same pass
+        items = self.items
+        write = 0
+        for item in items:
             if hasattr(item, 'update'):
                 item.update(dt)
-            if self._is_item_expired(item):
-                expired_items.append(item)
-
-        # Remove expired items
-        for item in expired_items:
-            self.items.remove(item)
+            if not self._is_item_expired(item):
+                items[write] = item
+                write += 1
+        del items[write:]
 
         # Update spawn timers
         self.spawn_timer += dt
@@ -202,9 +234,14 @@ class ItemSpawner:
             if near_player and player_pos:
                 # Spawn within a radius of the player
                 radius = random.uniform(100, 300)  # 100-300 pixels from player
-                angle = random.uniform(0, 2 * math.pi)
-                x = player_pos[0] + radius * math.cos(angle)
-                y = player_pos[1] + radius * math.sin(angle)
+                dir_x, dir_y = random.choice(_SPAWN_DIRECTIONS)
+                x = player_pos[0] + radius * dir_x
+                y = player_pos[1] + radius * dir_y
+            elif self.spawn_tiles:
+                # Spawn anywhere on the map, picking from tiles that are clear of walls
+                tile_x, tile_y = random.choice(self.spawn_tiles)
+                x = tile_x * TILE_SIZE + random.uniform(0, TILE_SIZE)
+                y = tile_y * TILE_SIZE + random.uniform(0, TILE_SIZE)
             else:
                 # Spawn anywhere on the map
                 x = random.uniform(0, MAP_WIDTH * TILE_SIZE)
@@ -246,8 +283,9 @@ class ItemSpawner:
 
         # Check if too close to existing items
         for item in self.items:
-            distance = math.sqrt((x - item.x) ** 2 + (y - item.y) ** 2)
-            if distance < 50:  # Minimum 50 pixels between items
+            dx = x - item.x
+            dy = y - item.y
+            if dx * dx + dy * dy < 50 * 50:  # Minimum 50 pixels between items, compared squared
                 return False
 
         return True
@@ -261,21 +299,25 @@ class ItemSpawner:
         Returns:
             list: List of picked up items
         """
+        if not self.items:
+            return []  # Nothing to pick up on most frames
+
         picked_up_items = []
+        player_x, player_y = player.x, player.y
+        pickup_radius_sq = 40 * 40  # Increased pickup radius for better usability, compared squared
 
-        for item in self.items[:]:  # Use slice to avoid modification during iteration
+        for item in self.items:  # Picked up items are removed in one pass after the loop
             if self._is_item_expired(item):
                 continue
 
             # Check collision with player
-            distance = math.sqrt((player.x - item.x) ** 2 + (player.y - item.y) ** 2)
-            pickup_radius = 40  # Increased pickup radius for better usability
+            dx = player_x - item.x
+            dy = player_y - item.y
 
-            if distance <= pickup_radius:
+            if dx * dx + dy * dy <= pickup_radius_sq:
                 # Try to pickup item using available method
                 if self._try_pickup_item(item, player):
                     picked_up_items.append(item)
-                    self.items.remove(item)  # Remove from items list after successful pickup
 
                     # Show pickup notification if UI is available
                     if self.ui:
@@ -291,6 +333,17 @@ class ItemSpawner:
 
                         self.ui.show_pickup_message(f"Picked up {item_name}")
 
+        if picked_up_items:
+            # Remove collected items from the list, compacting in place with an identity set lookup
+            picked = set(map(id, picked_up_items))
+            items = self.items
+            write = 0
+            for item in items:
+                if id(item) not in picked:
+                    items[write] = item
+                    write += 1
+            del items[write:]
+
         return picked_up_items
 
     def render(self, screen, camera_offset):
@@ -300,9 +353,25 @@ class ItemSpawner:
             screen: Pygame screen surface
             camera_offset: Camera offset (x, y)
         """
+        # Margin covers the bobbing offset and weapon sprites larger than the item rect
+        margin = 64
+        left = camera_offset[0] - margin
+        top = camera_offset[1] - margin
+        right = camera_offset[0] + screen.get_width() + margin
+        bottom = camera_offset[1] + screen.get_height() + margin
+
+        # Sprites are collected and drawn with a single blits() call
+        blits = []
         for item in self.items:
-            if not self._is_item_expired(item):
-                item.render(screen, camera_offset)
+            if left - item.rect.width < item.x < right and top - item.rect.height < item.y < bottom:
+                if not self._is_item_expired(item):
+                    blit = item.get_blit(camera_offset)
+                    if blit:
+                        blits.append(blit)
+                    else:
+                        item.render(screen, camera_offset)
+        if blits:
+            screen.blits(blits, False)
 
     def get_items_info(self):
         """Get information about current items for debugging
@@ -71,15 +71,27 @@ class Item:
         """Update item (animation, etc.)"""
         self.bob_time += dt
 
+    def _screen_position(self, camera_offset):
+        """Get the on-screen draw position including the bobbing animation"""
+        bob_offset = math.sin(self.bob_time * self.bob_speed) * self.bob_height
+        return self.rect.x - camera_offset[0], self.rect.y - camera_offset[1] + bob_offset
+
+    def get_blit(self, camera_offset=(0, 0)):
+        """Get the sprite and position for batched rendering with Surface.blits
+
+        Args:
+            camera_offset (tuple): Camera offset (x, y)
+
+        Returns:
+            tuple: (sprite, (x, y)), or None if the item has no sprite and must use render()
+        """
+        if not self.sprite:
+            return None
+        return self.sprite, self._screen_position(camera_offset)
+
     def render(self, screen, camera_offset=(0, 0)):
         """Render the item"""
-        # Calculate screen position with camera offset
-        screen_x = self.rect.x - camera_offset[0]
-        screen_y = self.rect.y - camera_offset[1]
-
-        # Add bobbing animation
-        bob_offset = math.sin(self.bob_time * self.bob_speed) * self.bob_height
-        render_y = screen_y + bob_offset
+        screen_x, render_y = self._screen_position(camera_offset)
 
         if self.sprite:
             screen.blit(self.sprite, (screen_x, render_y))
@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from utils.constants import (
     WHITE, RED, GREEN, BLUE, BLACK, GRAY,
     PICKUP_NOTIFICATION_DURATION,
@@ -6,6 +7,7 @@ from utils.constants import (
     WEAPON_ICON_SIZE, WEAPON_INVENTORY_PADDING,
     WEAPON_INVENTORY_RIGHT_MARGIN, WEAPON_INVENTORY_BOTTOM_MARGIN
 )
+from utils.fonts import get_font
 
 
 class NotificationSystem:
@@ -17,9 +19,13 @@ class NotificationSystem:
         Args:
             font_size (int): Size of notification text
         """
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(None, font_size)
         self.notifications = []  # List of active notifications
 
+        # Rendered (text, shadow) surfaces for recent messages, pickup and damage texts repeat a lot
+        self._surface_cache = OrderedDict()
+        self._surface_cache_size = 32
+
     def add_notification(self, message, duration=PICKUP_NOTIFICATION_DURATION,
                          color=WHITE, position="center"):
         """Add a new notification
@@ -30,15 +36,42 @@ class NotificationSystem:
             color (tuple): RGB color for text
             position (str): "center", "top", "bottom", "top-left", etc.
         """
+        surface, shadow = self._render_message(message, color)
         notification = {
             'message': message,
             'timer': duration,
             'color': color,
             'position': position,
-            'surface': self.font.render(message, True, color)
+            'surface': surface,
+            'shadow': shadow  # Rendered once, only its alpha changes
         }
         self.notifications.append(notification)
 
+    def _render_message(self, message, color):
+        """Get text and shadow surfaces for a message, reusing recently rendered ones
+
+        Shared surfaces are safe because alpha is set right before each blit.
+
+        Args:
+            message (str): Text to render
+            color (tuple): RGB color for text
+
+        Returns:
+            tuple: (text surface, black shadow surface)
+        """
+        key = (message, color)
+        cache = self._surface_cache
+        surfaces = cache.get(key)
+        if surfaces is not None:
+            cache.move_to_end(key)
+            return surfaces
+
+        surfaces = (self.font.render(message, True, color), self.font.render(message, True, BLACK))
+        cache[key] = surfaces
+        if len(cache) > self._surface_cache_size:
+            cache.popitem(last=False)  # Drop the least recently used message
+        return surfaces
+
     def add_pickup_message(self, message):
         """Convenience method for pickup notifications"""
         self.add_notification(message, color=GREEN, position="center-bottom")
@@ -57,6 +90,9 @@ class NotificationSystem:
         Args:
             dt (float): Time delta in seconds
         """
+        if not self.notifications:
+            return
+
         # Update timers and remove expired notifications
         updated_notifications = []
         for notif in self.notifications:
@@ -72,6 +108,8 @@ class NotificationSystem:
         Args:
             screen (pygame.Surface): Screen to render on
         """
+        if not self.notifications:
+            return
 
         # Group notifications by position
         position_groups = {}
@@ -141,7 +179,7 @@ class NotificationSystem:
             surface.set_alpha(alpha)
 
             # Render with shadow for better readability
-            shadow_surface = self.font.render(notif['message'], True, BLACK)
+            shadow_surface = notif['shadow']
             shadow_surface.set_alpha(alpha // 2)
             screen.blit(shadow_surface, (x + 2, y + 2))
             screen.blit(surface, (x, y))
@@ -155,12 +193,15 @@ class GameUI:
     def __init__(self):
         """Initialize the UI system"""
         self.notification_system = NotificationSystem()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 24)
 
         # UI state
         self.show_debug = False
 
+        # HUD text surfaces keyed by slot, re-rendered only when the displayed text changes
+        self._text_cache = {}
+
         # Weapon icons cache
         self.weapon_icons = {}
         self._load_weapon_icons()
@@ -260,7 +301,7 @@ class GameUI:
         self._render_health_bar(screen, player.health, player.max_health)
 
         # Score
-        score_text = self.font.render(f"Score: {score}", True, WHITE)
+        score_text = self._cached_text("score", self.font, f"Score: {score}")
         screen.blit(score_text, (10, 50))
 
         # Current weapon info (text version)
@@ -270,7 +311,7 @@ class GameUI:
             if weapon_info['is_reloading']:
                 weapon_text += " (Reloading...)"
 
-            weapon_surface = self.small_font.render(weapon_text, True, WHITE)
+            weapon_surface = self._cached_text("weapon", self.small_font, weapon_text)
             screen.blit(weapon_surface, (10, 80))
 
         # Weapon inventory (visual icons)
@@ -278,9 +319,26 @@ class GameUI:
 
         # FPS (if enabled)
         if self.show_debug and fps > 0:
-            fps_text = self.small_font.render(f"FPS: {fps:.1f}", True, WHITE)
+            fps_text = self._cached_text("fps", self.small_font, f"FPS: {fps:.1f}")
             screen.blit(fps_text, (WINDOW_WIDTH - 100, 10))
 
+    def _cached_text(self, slot, font, text):
+        """Get a rendered HUD text surface, reusing the previous one while the text is unchanged
+
+        Args:
+            slot: Key identifying the HUD element
+            font (pygame.font.Font): Font to render with
+            text (str): Text to display
+
+        Returns:
+            pygame.Surface: Rendered white text
+        """
+        cached = self._text_cache.get(slot)
+        if cached is None or cached[0] != text:
+            cached = (text, font.render(text, True, WHITE))
+            self._text_cache[slot] = cached
+        return cached[1]
+
     def _render_weapon_inventory(self, screen, player):
         """Render weapon inventory as icons on the right side
 
@@ -336,7 +394,7 @@ class GameUI:
 
                     # Add weapon number/slot indicator
                     slot_number = rendered_count + 1
-                    number_text = self.small_font.render(str(slot_number), True, WHITE)
+                    number_text = self._cached_text(("slot", slot_number), self.small_font, str(slot_number))
                     number_x = icon_x + WEAPON_ICON_SIZE - number_text.get_width() - 2
                     number_y = icon_y + 2
 
@@ -382,7 +440,7 @@ class GameUI:
 
         # Health text
         health_text = f"{int(current_health)}/{int(max_health)}"
-        text_surface = self.small_font.render(health_text, True, WHITE)
+        text_surface = self._cached_text("health", self.small_font, health_text)
         text_x = x + bar_width // 2 - text_surface.get_width() // 2
         text_y = y + bar_height // 2 - text_surface.get_height() // 2
         screen.blit(text_surface, (text_x, text_y))
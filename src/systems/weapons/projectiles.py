@@ -1,7 +1,6 @@
 import pygame
 import math
 from entities.entity import Entity
-from systems import collisions
 from utils.constants import (
     BULLET_SIZE, BULLET_SPEED, BULLET_COLOR,
     # Weapon-specific bullet colors and speeds
@@ -11,10 +10,18 @@ from utils.constants import (
     MAP_WIDTH, MAP_HEIGHT, TILE_SIZE
 )
 
+# Map bounds in pixels - bullets disappear once they leave this area
+MAP_WIDTH_PX = MAP_WIDTH * TILE_SIZE
+MAP_HEIGHT_PX = MAP_HEIGHT * TILE_SIZE
+
 
 class Bullet(Entity):
     """Base bullet entity - základní projektil"""
 
+    __slots__ = ('angle', 'damage', 'speed', 'vx', 'vy', 'distance_traveled', 'max_distance',
+                 'is_explosive', 'explosion_radius', 'lifetime', 'min_travel_time',
+                 'hit_wall', 'wall_hit_explosion')
+
     def __init__(self, x, y, angle, damage, color=BULLET_COLOR, speed=BULLET_SPEED, size=BULLET_SIZE):
         """Initialize the bullet
 
@@ -31,6 +38,9 @@ class Bullet(Entity):
         self.angle = angle
         self.damage = damage
         self.speed = speed
+        # Velocity is fixed for the bullet's lifetime, so resolve it once here
+        self.vx = math.cos(angle) * speed
+        self.vy = math.sin(angle) * speed
         self.distance_traveled = 0
         self.max_distance = 1500  # Increased default range
         self.is_explosive = False  # Whether the bullet explodes on impact
@@ -50,31 +60,23 @@ class Bullet(Entity):
         # Update lifetime
         self.lifetime += dt
 
-        # Calculate movement vector
-        dx = math.cos(self.angle) * self.speed * dt
-        dy = math.sin(self.angle) * self.speed * dt
-
-        # Update position
-        old_x, old_y = self.x, self.y
-        self.x += dx
-        self.y += dy
+        # Update position using the precomputed velocity
+        self.x += self.vx * dt
+        self.y += self.vy * dt
 
-        # Update distance traveled
-        self.distance_traveled += math.sqrt(dx * dx + dy * dy)
+        # Update distance traveled (velocity magnitude is exactly speed)
+        self.distance_traveled += self.speed * dt
 
         # Check map boundaries first (bullets disappear when leaving map)
-        map_width_px = MAP_WIDTH * TILE_SIZE
-        map_height_px = MAP_HEIGHT * TILE_SIZE
-
-        if (self.x < 0 or self.x > map_width_px or
-                self.y < 0 or self.y > map_height_px):
+        if (self.x < 0 or self.x > MAP_WIDTH_PX or
+                self.y < 0 or self.y > MAP_HEIGHT_PX):
             self.distance_traveled = self.max_distance  # Mark for removal
             return
 
         # Only check wall collision after minimum travel time to prevent instant hits
         if self.lifetime > self.min_travel_time:
-            # Check for collision with walls using the collision system
-            if map_generator and not collisions.is_position_walkable(self.x + self.width / 2, self.y + self.height / 2):
+            # Check for collision with walls straight against the map, the collision system wraps the same lookup
+            if map_generator and not map_generator.is_walkable(self.x + self.width / 2, self.y + self.height / 2):
                 # Store explosion data before marking for removal
                 self.wall_hit_explosion = self.explode() if self.is_explosive else None
                 self.distance_traveled = self.max_distance  # Mark for removal
@@ -101,8 +103,9 @@ class Bullet(Entity):
             camera_offset (tuple): Camera offset (x, y)
         """
         # Calculate center position
-        center_x = int(self.rect.x + self.width // 2 - camera_offset[0])
-        center_y = int(self.rect.y + self.height // 2 - camera_offset[1])
+        # Rect coordinates and the gameplay camera offset are whole pixels already
+        center_x = self.rect.x + self.width // 2 - camera_offset[0]
+        center_y = self.rect.y + self.height // 2 - camera_offset[1]
 
         # Draw bullet as a small circle
         pygame.draw.circle(screen, self.color, (center_x, center_y), max(2, self.width // 2))
@@ -146,6 +149,8 @@ class Bullet(Entity):
 class PistolBullet(Bullet):
     """Pistol bullet - Standard bullet with medium speed and damage"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, angle, damage):
         """Initialize the pistol bullet"""
         super().__init__(
@@ -163,6 +168,8 @@ class PistolBullet(Bullet):
 class ShotgunPellet(Bullet):
     """Shotgun pellet - Small, fast bullet with low damage but shorter range"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, angle, damage):
         """Initialize the shotgun pellet"""
         super().__init__(
@@ -180,6 +187,8 @@ class ShotgunPellet(Bullet):
 class AssaultRifleBullet(Bullet):
     """Assault rifle bullet - Fast bullet with medium damage"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, angle, damage):
         """Initialize the assault rifle bullet"""
         super().__init__(
@@ -197,6 +206,8 @@ class AssaultRifleBullet(Bullet):
 class SniperRifleBullet(Bullet):
     """Sniper rifle bullet - Very fast bullet with high damage and long range"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, angle, damage):
         """Initialize the sniper rifle bullet"""
         super().__init__(
@@ -215,6 +226,8 @@ class SniperRifleBullet(Bullet):
 class BazookaRocket(Bullet):
     """Bazooka rocket - Slow bullet with explosive damage"""
 
+    __slots__ = ()
+
     def __init__(self, x, y, angle, damage):
         """Initialize the bazooka rocket"""
         super().__init__(
@@ -239,8 +252,9 @@ class BazookaRocket(Bullet):
             camera_offset (tuple): Camera offset (x, y)
         """
         # Calculate center position
-        center_x = int(self.rect.x + self.width // 2 - camera_offset[0])
-        center_y = int(self.rect.y + self.height // 2 - camera_offset[1])
+        # Rect coordinates and the gameplay camera offset are whole pixels already
+        center_x = self.rect.x + self.width // 2 - camera_offset[0]
+        center_y = self.rect.y + self.height // 2 - camera_offset[1]
 
         # Draw rocket body as a larger circle
         pygame.draw.circle(screen, self.color, (center_x, center_y), self.width // 2)
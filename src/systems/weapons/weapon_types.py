@@ -94,11 +94,11 @@ class Weapon:
             angle (float): Angle in radians
 
         Returns:
-            Projectile or list or None: A new projectile(s) if shot was successful, None otherwise
+            list: The new projectile(s), empty if the weapon could not shoot
         """
         # Check if weapon can shoot
         if self.cooldown_timer > 0 or self.is_reloading or self.ammo <= 0:
-            return None
+            return []
 
         # Reset cooldown timer
         self.cooldown_timer = self.cooldown
@@ -114,7 +114,7 @@ class Weapon:
 
         # Import here to avoid circular imports
         from .projectiles import Bullet
-        return Bullet(weapon_x, weapon_y, spread_angle, self.damage)
+        return [Bullet(weapon_x, weapon_y, spread_angle, self.damage)]
 
     def get_muzzle_position(self, player_x, player_y, aim_angle):
         """Get weapon muzzle position for effects like muzzle flash
@@ -169,7 +169,7 @@ class Pistol(Weapon):
     def shoot(self, x, y, angle):
         """Shoot a pistol bullet"""
         if not self.can_shoot():
-            return None
+            return []
 
         self.cooldown_timer = self.cooldown
         self.ammo -= 1
@@ -179,7 +179,7 @@ class Pistol(Weapon):
         spread_angle = angle + random.uniform(-self.spread, self.spread)
 
         from .projectiles import PistolBullet
-        return PistolBullet(weapon_x, weapon_y, spread_angle, self.damage)
+        return [PistolBullet(weapon_x, weapon_y, spread_angle, self.damage)]
 
 
 class Shotgun(Weapon):
@@ -200,10 +200,10 @@ class Shotgun(Weapon):
         """Shoot multiple shotgun pellets
 
         Returns:
-            list: List of pellets if shot was successful, None otherwise
+            list: List of pellets, empty if the weapon could not shoot
         """
         if not self.can_shoot():
-            return None
+            return []
 
         self.cooldown_timer = self.cooldown
         self.ammo -= 1
@@ -240,7 +240,7 @@ class AssaultRifle(Weapon):
     def shoot(self, x, y, angle):
         """Shoot an assault rifle bullet"""
         if not self.can_shoot():
-            return None
+            return []
 
         self.cooldown_timer = self.cooldown
         self.ammo -= 1
@@ -250,7 +250,7 @@ class AssaultRifle(Weapon):
         spread_angle = angle + random.uniform(-self.spread, self.spread)
 
         from .projectiles import AssaultRifleBullet
-        return AssaultRifleBullet(weapon_x, weapon_y, spread_angle, self.damage)
+        return [AssaultRifleBullet(weapon_x, weapon_y, spread_angle, self.damage)]
 
 
 class SniperRifle(Weapon):
@@ -270,7 +270,7 @@ class SniperRifle(Weapon):
     def shoot(self, x, y, angle):
         """Shoot a sniper rifle bullet"""
         if not self.can_shoot():
-            return None
+            return []
 
         self.cooldown_timer = self.cooldown
         self.ammo -= 1
@@ -280,7 +280,7 @@ class SniperRifle(Weapon):
         spread_angle = angle + random.uniform(-self.spread, self.spread)
 
         from .projectiles import SniperRifleBullet
-        return SniperRifleBullet(weapon_x, weapon_y, spread_angle, self.damage)
+        return [SniperRifleBullet(weapon_x, weapon_y, spread_angle, self.damage)]
 
 
 class Bazooka(Weapon):
@@ -300,7 +300,7 @@ class Bazooka(Weapon):
     def shoot(self, x, y, angle):
         """Shoot a bazooka rocket"""
         if not self.can_shoot():
-            return None
+            return []
 
         self.cooldown_timer = self.cooldown
         self.ammo -= 1
@@ -310,4 +310,4 @@ class Bazooka(Weapon):
         spread_angle = angle + random.uniform(-self.spread, self.spread)
 
         from .projectiles import BazookaRocket
-        return BazookaRocket(weapon_x, weapon_y, spread_angle, self.damage)
\ No newline at end of file
+        return [BazookaRocket(weapon_x, weapon_y, spread_angle, self.damage)]
\ No newline at end of file
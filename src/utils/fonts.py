@@ -0,0 +1,25 @@
+"""
+Fonts - Shared Font Cache
+=========================
+
+Font objects are loaded once per (name, size) and shared by every state and UI
+component, so recreating a state does not reopen and parse the font file again.
+"""
+
+import functools
+import pygame
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Get a cached font, loading it on first use.
+
+    Args:
+        name: Font file path, or None for the default pygame font
+        size: Font size in pixels
+
+    Returns:
+        pygame.font.Font: Shared font instance
+    """
+    return pygame.font.Font(name, size)
@@ -0,0 +1,47 @@
+"""Game state transition tests, run headless from the src directory like the game itself"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+os.chdir(SRC_DIR)  # Assets are loaded relative to src
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((800, 600))
+
+from utils.sprite_loader import load_all_assets
+
+load_all_assets()
+
+from game.game_state import GameStateManager
+from systems.weapons import WeaponFactory
+
+
+def _keydown(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+def test_cycling_weapons_keeps_gameplay_state():
+    manager = GameStateManager()
+    manager._change_state("gameplay")
+    manager.gameplay.player.add_weapon(WeaponFactory.create_weapon("shotgun"))
+
+    manager.handle_event(_keydown(pygame.K_e))
+    manager.handle_event(_keydown(pygame.K_q))
+
+    assert manager.current_state == "gameplay"
+    assert manager.active is manager.gameplay
+
+
+def test_unknown_state_is_ignored():
+    manager = GameStateManager()
+    manager._change_state(True)
+
+    assert manager.current_state == "menu"
+    assert manager.active is manager.menu